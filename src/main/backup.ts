@@ -1,8 +1,9 @@
-import archiver from 'archiver';
+import type archiver from 'archiver';
 import crypto from 'node:crypto';
 import fs from 'node:fs';
 import path from 'node:path';
 import type {
+  AppConfig,
   BackupError,
   BackupFile,
   BackupRunResult,
@@ -10,12 +11,52 @@ import type {
 } from '../shared/types';
 import { WOW_FLAVORS } from '../shared/types';
 import { loadConfig } from './config';
-import { emitProgress, newProgressId } from './progress';
-import { metaPathFor, readMeta, writeLocalMeta } from './metadata';
+import { emitProgress, newProgressId, percentGate } from './progress';
+import { IO_CONCURRENCY, mapWithConcurrency } from './concurrency';
+import {
+  byCreatedDesc,
+  forgetLocalMeta,
+  metaPathFor,
+  readLocalMeta,
+  writeLocalMeta
+} from './metadata';
 
 const BACKUP_PREFIX = 'wow-addons';
+/** Sentinel createdAtIso for names that don't parse; replaced by mtime. */
+const EPOCH_ISO = new Date(0).toISOString();
+// archiver emits many small chunks; a deeper write buffer lets the file
+// stream coalesce them into fewer, larger writes (it flushes via writev).
+const ZIP_WRITE_BUFFER_BYTES = 1024 * 1024;
+// Compiled once; these run for every archive entry / listed file.
+const SKIP_ENTRY_RE = /(^|\/)(\.git|node_modules)(\/|$)/;
+// Already-compressed addon assets: deflating them burns CPU for ~0% gain, so
+// they go into the zip stored. (.tga/.lua/.toc etc. still compress well.)
+const STORED_EXTENSIONS = new Set([
+  '.blp', '.png', '.jpg', '.jpeg',
+  '.ogg', '.mp3',
+  '.zip', '.gz', '.zst', '.mpq'
+]);
+// Below this, deflate's block overhead outweighs anything it could save.
+const STORE_BELOW_BYTES = 64;
+// Groups: flavor, then local-time year, month, day, hour, minute, second.
+const BACKUP_NAME_RE =
+  /^wow-addons_(.+?)_(\d{4})-(\d{2})-(\d{2})_(\d{2})-(\d{2})-(\d{2})\.zip$/;
+const DAY_MS = 86_400_000;
+// Time Machine retention tiers: keep all, then weekly, monthly, yearly.
+const KEEP_ALL_MS = 7 * DAY_MS;
+const KEEP_WEEKLY_MS = 31 * DAY_MS;
+const KEEP_MONTHLY_MS = 365 * DAY_MS;
 const activeBackupTargets = new Set<string>();
 
+// archiver drags in zip-stream, readdir-glob, lazystream, etc. Most launches
+// (tray, scheduler wake-ups with nothing to do) never zip anything, so load
+// it on first use instead of at startup.
+let archiverFactory: typeof archiver | null = null;
+async function loadArchiver(): Promise<typeof archiver> {
+  archiverFactory ??= (await import('archiver')).default;
+  return archiverFactory;
+}
+
 function timestamp(): string {
   const d = new Date();
   const pad = (n: number) => String(n).padStart(2, '0');
@@ -33,20 +74,28 @@ function wtfDirFor(installRoot: string, flavor: WowFlavor): string {
   return path.join(installRoot, flavor, 'WTF');
 }
 
+/** Single async stat; false for missing paths and non-directories alike. */
+async function isDirectory(p: string): Promise<boolean> {
+  try {
+    return (await fs.promises.stat(p)).isDirectory();
+  } catch {
+    return false;
+  }
+}
+
 function parseBackupFileName(name: string): {
   flavor: WowFlavor | 'unknown';
   createdAtIso: string;
 } {
-  const m = name.match(
-    /^wow-addons_(.+?)_(\d{4}-\d{2}-\d{2})_(\d{2}-\d{2}-\d{2})\.zip$/
-  );
-  if (!m) return { flavor: 'unknown', createdAtIso: new Date(0).toISOString() };
+  const m = BACKUP_NAME_RE.exec(name);
+  if (!m) return { flavor: 'unknown', createdAtIso: EPOCH_ISO };
   const flavor = (WOW_FLAVORS as string[]).includes(m[1])
     ? (m[1] as WowFlavor)
     : 'unknown';
-  const [, , date, time] = m;
-  const iso = `${date}T${time.replace(/-/g, ':')}`;
-  return { flavor, createdAtIso: new Date(iso).toISOString() };
+  // Build the Date from the captured fields (local time, as timestamp()
+  // writes them) rather than assembling and re-parsing an ISO string.
+  const created = new Date(+m[2], +m[3] - 1, +m[4], +m[5], +m[6], +m[7]);
+  return { flavor, createdAtIso: created.toISOString() };
 }
 
 export function toBackupFile(absPath: string): BackupFile {
@@ -58,34 +107,66 @@ export function toBackupFile(absPath: string): BackupFile {
     name,
     flavor: parsed.flavor,
     sizeBytes: stat.size,
-    createdAtIso: parsed.createdAtIso === new Date(0).toISOString()
+    createdAtIso: parsed.createdAtIso === EPOCH_ISO
       ? stat.mtime.toISOString()
       : parsed.createdAtIso
   };
 }
 
+function isBackupEntry(e: fs.Dirent): boolean {
+  return e.isFile() && e.name.startsWith(BACKUP_PREFIX) && e.name.endsWith('.zip');
+}
+
 export function listBackupsIn(dir: string): BackupFile[] {
-  if (!fs.existsSync(dir)) return [];
-  return fs
-    .readdirSync(dir)
-    .filter((f) => f.startsWith(BACKUP_PREFIX) && f.endsWith('.zip'))
-    .map((f) => toBackupFile(path.join(dir, f)))
-    .sort((a, b) => b.createdAtIso.localeCompare(a.createdAtIso));
+  let entries: fs.Dirent[];
+  try {
+    // Dirent types come back with the listing, so only real backup files
+    // get a stat (for their size) and the folder itself isn't probed first.
+    entries = fs.readdirSync(dir, { withFileTypes: true });
+  } catch (err) {
+    if ((err as NodeJS.ErrnoException).code === 'ENOENT') return [];
+    throw err;
+  }
+  return entries
+    .filter(isBackupEntry)
+    .map((e) => toBackupFile(path.join(dir, e.name)))
+    .sort(byCreatedDesc);
 }
 
+/** Backup file names in `dir`: one readdir, no per-file stat. */
+export async function listBackupNamesIn(dir: string): Promise<string[]> {
+  try {
+    const entries = await fs.promises.readdir(dir, { withFileTypes: true });
+    return entries.filter(isBackupEntry).map((e) => e.name);
+  } catch (err) {
+    if ((err as NodeJS.ErrnoException).code === 'ENOENT') return [];
+    throw err;
+  }
+}
+
+/** Backups in a local folder with their sidecars (cached; see readLocalMeta). */
 export async function listBackupsWithMeta(dir: string): Promise<BackupFile[]> {
   const base = listBackupsIn(dir);
-  return Promise.all(
-    base.map(async (b) => ({ ...b, meta: await readMeta(b.path) }))
-  );
+  return mapWithConcurrency(base, IO_CONCURRENCY, async (b) => ({
+    ...b,
+    meta: await readLocalMeta(b.path)
+  }));
 }
 
 export function isBackupPathInProgress(absPath: string): boolean {
   return activeBackupTargets.has(path.resolve(absPath));
 }
 
-function shouldSkipArchiveEntry(entryName: string): boolean {
-  return /(^|\/)(\.git|node_modules)(\/|$)/.test(entryName);
+function filterArchiveEntry(entry: archiver.EntryData): false | archiver.ZipEntryData {
+  if (SKIP_ENTRY_RE.test(entry.name)) return false;
+  const size = entry.stats?.size;
+  if (
+    (size !== undefined && size < STORE_BELOW_BYTES) ||
+    STORED_EXTENSIONS.has(path.extname(entry.name).toLowerCase())
+  ) {
+    return { ...entry, store: true };
+  }
+  return entry;
 }
 
 /**
@@ -93,7 +174,7 @@ function shouldSkipArchiveEntry(entryName: string): boolean {
  * Windows fs.rm can fail on deep trees / long paths / antivirus locks,
  * so fall back to a manual recursive delete.
  */
-async function rmdirTree(dir: string): Promise<void> {
+export async function rmdirTree(dir: string): Promise<void> {
   try {
     await fs.promises.rm(dir, { recursive: true, force: true, maxRetries: 3 });
     return;
@@ -104,17 +185,34 @@ async function rmdirTree(dir: string): Promise<void> {
 }
 
 async function _rmdirRecursive(dir: string): Promise<void> {
-  if (!fs.existsSync(dir)) return;
-  const entries = await fs.promises.readdir(dir, { withFileTypes: true });
-  for (const entry of entries) {
-    const fullPath = path.join(dir, entry.name);
-    if (entry.isDirectory()) {
-      await _rmdirRecursive(fullPath);
-    } else {
-      await fs.promises.unlink(fullPath).catch(() => {});
+  // Walk first, then unlink as one flat, bounded batch: a recursive
+  // Promise.all would queue every file in the tree on the libuv pool at
+  // once (thousands for an AddOns folder).
+  const files: string[] = [];
+  const dirs: string[] = [];
+  async function walk(d: string): Promise<void> {
+    let entries: fs.Dirent[];
+    try {
+      entries = await fs.promises.readdir(d, { withFileTypes: true });
+    } catch {
+      return; // Already gone (or unreadable, which rmdir would fail on too).
+    }
+    dirs.push(d);
+    for (const entry of entries) {
+      const fullPath = path.join(d, entry.name);
+      if (entry.isDirectory()) await walk(fullPath);
+      else files.push(fullPath);
     }
   }
-  await fs.promises.rmdir(dir).catch(() => {});
+  await walk(dir);
+
+  await mapWithConcurrency(files, IO_CONCURRENCY, (f) =>
+    fs.promises.unlink(f).catch(() => {})
+  );
+  // Parents are pushed before their children, so reverse order is deepest first.
+  for (const d of dirs.reverse()) {
+    await fs.promises.rmdir(d).catch(() => {});
+  }
 }
 
 async function zipDirectory(
@@ -123,15 +221,20 @@ async function zipDirectory(
   wtfDir: string | null,
   outPath: string,
   progressId: string,
-  label: string
+  label: string,
+  level: number
 ): Promise<{ entryCount: number; sha256: string }> {
   await fs.promises.mkdir(path.dirname(outPath), { recursive: true });
+  const createArchive = await loadArchiver();
   let entryCount = 0;
 
   return new Promise((resolve, reject) => {
-    const output = fs.createWriteStream(outPath);
-    const archive = archiver('zip', { zlib: { level: 6 } });
+    const output = fs.createWriteStream(outPath, {
+      highWaterMark: ZIP_WRITE_BUFFER_BYTES
+    });
+    const archive = createArchive('zip', { zlib: { level } });
     const hash = crypto.createHash('sha256');
+    const shouldReport = percentGate();
     let completed = false;
 
     function finish(err: unknown = null) {
@@ -154,11 +257,13 @@ async function zipDirectory(
       const total = data.entries.total || 1;
       const processed = data.entries.processed || 0;
       entryCount = data.entries.total || entryCount;
+      const ratio = Math.min(1, processed / total);
+      if (!shouldReport(ratio)) return;
       emitProgress({
         id: progressId,
         phase: 'progress',
         label,
-        ratio: Math.min(1, processed / total),
+        ratio,
         message: `${processed}/${total} entries`
       });
     });
@@ -167,42 +272,53 @@ async function zipDirectory(
     });
 
     archive.pipe(output);
-    archive.directory(addonsDir, `${flavor}/AddOns`, (entry) => {
-      if (shouldSkipArchiveEntry(entry.name)) {
-        return false;
-      }
-      return entry;
-    });
+    archive.directory(addonsDir, `${flavor}/AddOns`, filterArchiveEntry);
     if (wtfDir) {
-      archive.directory(wtfDir, `${flavor}/WTF`, (entry) => {
-        if (shouldSkipArchiveEntry(entry.name)) {
-          return false;
-        }
-        return entry;
-      });
+      archive.directory(wtfDir, `${flavor}/WTF`, filterArchiveEntry);
     }
     archive.finalize();
   });
 }
 
-function pruneBackups(dir: string, flavor: WowFlavor, keep: number): void {
-  const matching = listBackupsIn(dir).filter((b) => b.flavor === flavor);
-  const toDelete = matching.slice(keep);
-  for (const f of toDelete) {
-    try {
-      fs.unlinkSync(f.path);
-    } catch (err) {
-      console.warn('Prune failed for', f.path, err);
-    }
-    const sidecar = metaPathFor(f.path);
-    if (fs.existsSync(sidecar)) {
-      try {
-        fs.unlinkSync(sidecar);
-      } catch {
-        // ignore
-      }
+/** Delete a pruned backup and its sidecar (which may not exist). */
+async function deleteBackupFiles(absPath: string): Promise<boolean> {
+  forgetLocalMeta(absPath);
+  const [zip] = await Promise.allSettled([
+    fs.promises.unlink(absPath),
+    fs.promises.unlink(metaPathFor(absPath)) // No sidecar is fine.
+  ]);
+  if (zip.status === 'rejected') {
+    console.warn('Prune failed for', absPath, zip.reason);
+    return false;
+  }
+  return true;
+}
+
+/**
+ * Delete pruned backups concurrently (each unlink is an independent
+ * metadata op) and log one summary line rather than one per file.
+ */
+async function deleteBackups(flavor: WowFlavor, victims: string[]): Promise<void> {
+  if (victims.length === 0) return;
+  const results = await mapWithConcurrency(victims, IO_CONCURRENCY, (p) =>
+    deleteBackupFiles(p)
+  );
+  const removed = results.filter(Boolean).length;
+  console.log(`Pruned ${removed} old ${flavor} backup(s).`);
+}
+
+async function pruneBackups(dir: string, flavor: WowFlavor, keep: number): Promise<void> {
+  const victims: string[] = [];
+  let kept = 0;
+  for (const b of listBackupsIn(dir)) {
+    if (b.flavor !== flavor) continue;
+    if (kept < keep) {
+      kept++;
+      continue;
     }
+    victims.push(b.path);
   }
+  await deleteBackups(flavor, victims);
 }
 
 // ---------------------------------------------------------------------------
@@ -213,7 +329,7 @@ function isoWeekKey(d: Date): string {
   const day = utc.getUTCDay() || 7; // convert Sunday(0) → 7
   utc.setUTCDate(utc.getUTCDate() + 4 - day); // shift to Thursday of the same week
   const yearStart = new Date(Date.UTC(utc.getUTCFullYear(), 0, 1));
-  const weekNum = Math.ceil(((utc.getTime() - yearStart.getTime()) / 86_400_000 + 1) / 7);
+  const weekNum = Math.ceil(((utc.getTime() - yearStart.getTime()) / DAY_MS + 1) / 7);
   return `${utc.getUTCFullYear()}-W${String(weekNum).padStart(2, '0')}`;
 }
 
@@ -224,44 +340,171 @@ function isoWeekKey(d: Date): string {
  *   • 31–365 days   → keep 1 per month     (most recent in each month)
  *   • > 365 days    → keep 1 per year      (most recent in each year)
  */
-function pruneBackupsTimeMachine(dir: string, flavor: WowFlavor): void {
+async function pruneBackupsTimeMachine(dir: string, flavor: WowFlavor): Promise<void> {
   const all = listBackupsIn(dir).filter((b) => b.flavor === flavor);
   if (all.length === 0) return;
 
   const now = Date.now();
-  const MS = 1000;
-  const DAY = 86_400 * MS;
-
-  const keep = new Set<string>();
-  const weekSeen = new Set<string>();
-  const monthSeen = new Set<string>();
-  const yearSeen = new Set<string>();
+  const victims: string[] = [];
+  // Bucket keys can't collide across tiers ("2026-W07", "2026-02", "2026"),
+  // so one set covers weeks, months and years.
+  const seen = new Set<string>();
 
   // `all` is already sorted newest-first, so the first backup in each bucket
-  // is always the most recent one.
+  // is always the most recent one; anything else in that bucket is a victim.
   for (const b of all) {
-    const age = now - new Date(b.createdAtIso).getTime();
-
-    if (age <= 7 * DAY) {
-      keep.add(b.path);
-    } else if (age <= 31 * DAY) {
-      const key = isoWeekKey(new Date(b.createdAtIso));
-      if (!weekSeen.has(key)) { weekSeen.add(key); keep.add(b.path); }
-    } else if (age <= 365 * DAY) {
-      const d = new Date(b.createdAtIso);
-      const key = `${d.getFullYear()}-${String(d.getMonth() + 1).padStart(2, '0')}`;
-      if (!monthSeen.has(key)) { monthSeen.add(key); keep.add(b.path); }
+    // Parse once; every bucket below derives its key from the same Date.
+    const d = new Date(b.createdAtIso);
+    const age = now - d.getTime();
+
+    let key: string;
+    if (age <= KEEP_ALL_MS) {
+      continue;
+    } else if (age <= KEEP_WEEKLY_MS) {
+      key = isoWeekKey(d);
+    } else if (age <= KEEP_MONTHLY_MS) {
+      key = `${d.getFullYear()}-${String(d.getMonth() + 1).padStart(2, '0')}`;
     } else {
-      const key = String(new Date(b.createdAtIso).getFullYear());
-      if (!yearSeen.has(key)) { yearSeen.add(key); keep.add(b.path); }
+      key = String(d.getFullYear());
     }
+    if (seen.has(key)) victims.push(b.path);
+    else seen.add(key);
   }
 
-  for (const b of all) {
-    if (keep.has(b.path)) continue;
-    try { fs.unlinkSync(b.path); } catch (err) { console.warn('Prune failed for', b.path, err); }
-    const sidecar = metaPathFor(b.path);
-    if (fs.existsSync(sidecar)) { try { fs.unlinkSync(sidecar); } catch { /* ignore */ } }
+  await deleteBackups(flavor, victims);
+}
+
+/** Size of the newest existing backup per flavor (listing is newest-first). */
+function lastBackupSizes(dir: string): Map<WowFlavor | 'unknown', number> {
+  const sizes = new Map<WowFlavor | 'unknown', number>();
+  for (const b of listBackupsIn(dir)) {
+    if (!sizes.has(b.flavor)) sizes.set(b.flavor, b.sizeBytes);
+  }
+  return sizes;
+}
+
+/** Free bytes available to this user on the volume holding `dir`, if known. */
+async function freeBytes(dir: string): Promise<number | null> {
+  try {
+    const st = await fs.promises.statfs(dir);
+    return st.bavail * st.bsize;
+  } catch {
+    return null;
+  }
+}
+
+function toMb(bytes: number): number {
+  return Math.round(bytes / 1024 / 1024);
+}
+
+// Two flavors at once: zlib is single-threaded per archive, so a second zip
+// uses another core while the first waits on disk. More than that mostly
+// just contends for the same disk.
+const BACKUP_CONCURRENCY = 2;
+
+type FlavorOutcome = { created: BackupFile } | { error: BackupError };
+
+interface BackupRunContext {
+  cfg: AppConfig;
+  expectedSizes: Map<WowFlavor | 'unknown', number>;
+  /** Expected bytes of zips currently being written by this run. */
+  reservedBytes: number;
+}
+
+function flavorError(flavor: WowFlavor, message: string): FlavorOutcome {
+  emitProgress({ id: newProgressId(), phase: 'error', label: 'Backing up ' + flavor, message });
+  return { error: { flavor, message } };
+}
+
+async function backupFlavor(
+  ctx: BackupRunContext,
+  flavor: WowFlavor
+): Promise<FlavorOutcome> {
+  const { cfg } = ctx;
+  const addonsDir = addonsDirFor(cfg.wowInstallRoot, flavor);
+  const wtfDir = wtfDirFor(cfg.wowInstallRoot, flavor);
+  // Both stats can be a network round-trip each; issue them together.
+  const [hasAddons, hasWtf] = await Promise.all([
+    isDirectory(addonsDir),
+    isDirectory(wtfDir)
+  ]);
+  if (!hasAddons) {
+    const message = `Missing AddOns folder: ${addonsDir}`;
+    console.warn(`Skipping ${flavor}: ${message}`);
+    return flavorError(flavor, message);
+  }
+
+  // Fail fast instead of zipping for minutes into a full disk. Space that
+  // other in-flight flavors are about to use counts as taken.
+  const expected = ctx.expectedSizes.get(flavor) ?? 0;
+  if (expected > 0) {
+    const free = await freeBytes(cfg.localBackupDir);
+    if (free !== null && free - ctx.reservedBytes < expected) {
+      const message =
+        `Not enough free space in ${cfg.localBackupDir}: ` +
+        `~${toMb(expected)} MB needed, ${toMb(Math.max(0, free - ctx.reservedBytes))} MB free`;
+      console.warn(`Skipping ${flavor}: ${message}`);
+      return flavorError(flavor, message);
+    }
+  }
+
+  const id = newProgressId();
+  const label = 'Backing up ' + flavor;
+  emitProgress({ id, phase: 'start', label });
+
+  const outName = BACKUP_PREFIX + '_' + flavor + '_' + timestamp() + '.zip';
+  const outPath = path.join(cfg.localBackupDir, outName);
+  const tempOutPath = `${outPath}.partial`;
+  activeBackupTargets.add(path.resolve(outPath));
+  ctx.reservedBytes += expected;
+  try {
+    // Keep incomplete backups hidden from listings and uploads until the zip is finished.
+    await fs.promises.unlink(tempOutPath).catch(() => {});
+
+    const { entryCount, sha256 } = await zipDirectory(
+      flavor,
+      addonsDir,
+      hasWtf ? wtfDir : null,
+      tempOutPath,
+      id,
+      label,
+      cfg.compressionLevel
+    );
+    await fs.promises.rename(tempOutPath, outPath);
+
+    // Write sidecar metadata for this backup.
+    try {
+      await writeLocalMeta(outPath, {
+        wowInstallRoot: cfg.wowInstallRoot,
+        entryCount,
+        sha256
+      });
+    } catch (metaErr) {
+      console.warn('Failed to write metadata sidecar:', metaErr);
+    }
+
+    if (cfg.retentionMode === 'time-machine') {
+      await pruneBackupsTimeMachine(cfg.localBackupDir, flavor);
+    } else {
+      await pruneBackups(cfg.localBackupDir, flavor, cfg.retentionCount);
+    }
+
+    emitProgress({ id, phase: 'done', label, ratio: 1 });
+    return { created: toBackupFile(outPath) };
+  } catch (err) {
+    const message = (err as Error).message;
+    console.error('Backup failed for ' + flavor + ':', err);
+    emitProgress({
+      id,
+      phase: 'error',
+      label,
+      message
+    });
+    await fs.promises.unlink(tempOutPath).catch(() => {});
+    return { error: { flavor, message } };
+  } finally {
+    ctx.reservedBytes -= expected;
+    activeBackupTargets.delete(path.resolve(outPath));
   }
 }
 
@@ -270,7 +513,7 @@ export async function runBackup(flavors: WowFlavor[]): Promise<BackupRunResult>
   const results: BackupFile[] = [];
   const errors: BackupError[] = [];
 
-  if (!fs.existsSync(cfg.wowInstallRoot)) {
+  if (!(await isDirectory(cfg.wowInstallRoot))) {
     const message = `WoW install root does not exist: ${cfg.wowInstallRoot}`;
     for (const flavor of flavors) {
       const id = newProgressId();
@@ -282,80 +525,27 @@ export async function runBackup(flavors: WowFlavor[]): Promise<BackupRunResult>
   }
 
   await fs.promises.mkdir(cfg.localBackupDir, { recursive: true });
+  const ctx: BackupRunContext = {
+    cfg,
+    // The previous backup is a cheap, good estimate of the next one's size;
+    // walking the source tree to measure it would cost as much as zipping.
+    expectedSizes: lastBackupSizes(cfg.localBackupDir),
+    reservedBytes: 0
+  };
 
-  for (const flavor of flavors) {
-    const addonsDir = addonsDirFor(cfg.wowInstallRoot, flavor);
-    const wtfDir = wtfDirFor(cfg.wowInstallRoot, flavor);
-    if (!fs.existsSync(addonsDir)) {
-      const message = `Missing AddOns folder: ${addonsDir}`;
-      const id = newProgressId();
-      const label = 'Backing up ' + flavor;
-      console.warn(`Skipping ${flavor}: ${message}`);
-      emitProgress({ id, phase: 'error', label, message });
-      errors.push({ flavor, message });
-      continue;
-    }
-
-    const id = newProgressId();
-    const label = 'Backing up ' + flavor;
-    emitProgress({ id, phase: 'start', label });
-
-    const outName = BACKUP_PREFIX + '_' + flavor + '_' + timestamp() + '.zip';
-    const outPath = path.join(cfg.localBackupDir, outName);
-    const tempOutPath = `${outPath}.partial`;
-    activeBackupTargets.add(path.resolve(outPath));
-    try {
-      // Keep incomplete backups hidden from listings and uploads until the zip is finished.
-      if (fs.existsSync(tempOutPath)) {
-        await fs.promises.unlink(tempOutPath).catch(() => {});
-      }
-
-      const { entryCount, sha256 } = await zipDirectory(
-        flavor,
-        addonsDir,
-        fs.existsSync(wtfDir) ? wtfDir : null,
-        tempOutPath,
-        id,
-        label
-      );
-      await fs.promises.rename(tempOutPath, outPath);
-
-      // Write sidecar metadata for this backup.
-      try {
-        await writeLocalMeta(outPath, {
-          wowInstallRoot: cfg.wowInstallRoot,
-          entryCount,
-          sha256
-        });
-      } catch (metaErr) {
-        console.warn('Failed to write metadata sidecar:', metaErr);
-      }
-
-      pruneBackups(cfg.localBackupDir, flavor, cfg.retentionCount);
-      if (cfg.retentionMode === 'time-machine') {
-        pruneBackupsTimeMachine(cfg.localBackupDir, flavor);
-      } else {
-        pruneBackups(cfg.localBackupDir, flavor, cfg.retentionCount);
-      }
-
-      emitProgress({ id, phase: 'done', label, ratio: 1 });
-      results.push(toBackupFile(outPath));
-    } catch (err) {
-      const message = (err as Error).message;
-      console.error('Backup failed for ' + flavor + ':', err);
-      emitProgress({
-        id,
-        phase: 'error',
-        label,
-        message
-      });
-      errors.push({ flavor, message });
-      if (fs.existsSync(tempOutPath)) {
-        await fs.promises.unlink(tempOutPath).catch(() => {});
-      }
-    } finally {
-      activeBackupTargets.delete(path.resolve(outPath));
-    }
+  // Largest first (by last backup size): with two workers, a big flavor
+  // started last would otherwise finish alone long after the rest.
+  const byCost = flavors
+    .map((flavor, index) => ({ flavor, index, cost: ctx.expectedSizes.get(flavor) ?? 0 }))
+    .sort((a, b) => b.cost - a.cost);
+  const outcomes = new Array<FlavorOutcome>(flavors.length);
+  await mapWithConcurrency(byCost, BACKUP_CONCURRENCY, async ({ flavor, index }) => {
+    outcomes[index] = await backupFlavor(ctx, flavor);
+  });
+  // Report in request order regardless of start or finish order.
+  for (const o of outcomes) {
+    if ('created' in o) results.push(o.created);
+    else errors.push(o.error);
   }
 
   return { created: results, errors };
@@ -0,0 +1,37 @@
+/**
+ * Default limit for batches of small independent file ops (sidecar reads,
+ * unlinks): enough in flight to hide SMB/disk latency without queuing a
+ * whole directory's worth on the libuv pool at once.
+ */
+export const IO_CONCURRENCY = 16;
+
+/**
+ * Run `fn` over `items` with at most `limit` calls in flight at once.
+ * Results keep the order of `items`. After the first failure no new calls
+ * start; the returned promise rejects with that error only once the calls
+ * already running have settled, so callers can clean up safely.
+ */
+export async function mapWithConcurrency<T, R>(
+  items: readonly T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let next = 0;
+  let failure: { error: unknown } | null = null;
+  // Workers never reject, so awaiting them all waits for every started call.
+  async function worker(): Promise<void> {
+    while (!failure && next < items.length) {
+      const i = next++;
+      try {
+        results[i] = await fn(items[i], i);
+      } catch (error) {
+        failure ??= { error };
+      }
+    }
+  }
+  const workerCount = Math.max(1, Math.min(limit, items.length));
+  await Promise.all(Array.from({ length: workerCount }, () => worker()));
+  if (failure) throw (failure as { error: unknown }).error;
+  return results;
+}
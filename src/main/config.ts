@@ -5,16 +5,22 @@ import type { AppConfig, RetentionMode, ScheduleConfig, ThemePreference, WowFlav
 import { WOW_FLAVORS } from '../shared/types';
 
 const CONFIG_FILE = 'config.json';
+const IS_WIN = process.platform === 'win32';
+const IS_MAC = process.platform === 'darwin';
 
+// userData never changes after startup (nothing calls app.setPath), so the
+// joined path is resolved once.
+let configFilePath: string | null = null;
 function configPath(): string {
-  return path.join(app.getPath('userData'), CONFIG_FILE);
+  configFilePath ??= path.join(app.getPath('userData'), CONFIG_FILE);
+  return configFilePath;
 }
 
 function defaultWowInstallRoot(): string {
-  if (process.platform === 'win32') {
+  if (IS_WIN) {
     return 'C:\\Program Files (x86)\\World of Warcraft';
   }
-  if (process.platform === 'darwin') {
+  if (IS_MAC) {
     return '/Applications/World of Warcraft';
   }
   return path.join(app.getPath('home'), 'World of Warcraft');
@@ -25,36 +31,60 @@ function defaultLocalBackupDir(): string {
 }
 
 function defaultMountPoint(): string {
-  if (process.platform === 'darwin') {
-    return path.join(app.getPath('home'), 'mnt', 'wowbackups');
-  }
-  if (process.platform === 'win32') return 'Z:';
+  if (IS_WIN) return 'Z:';
   return path.join(app.getPath('home'), 'mnt', 'wowbackups');
 }
 
+interface DefaultPaths {
+  wowInstallRoot: string;
+  localBackupDir: string;
+  mountPoint: string;
+}
+
+let defaultPaths: DefaultPaths | null = null;
+
+/** OS default locations. They can't change while the app runs, so resolve them once. */
+function getDefaultPaths(): DefaultPaths {
+  if (!defaultPaths) {
+    defaultPaths = {
+      wowInstallRoot: defaultWowInstallRoot(),
+      localBackupDir: defaultLocalBackupDir(),
+      mountPoint: defaultMountPoint()
+    };
+  }
+  return defaultPaths;
+}
+
+function defaultSchedule(): ScheduleConfig {
+  return {
+    enabled: false,
+    mode: 'interval',
+    intervalHours: 6,
+    dailyTime: '02:00',
+    cronExpression: ''
+  };
+}
+
 export function defaultConfig(): AppConfig {
+  const paths = getDefaultPaths();
   return {
-    wowInstallRoot: defaultWowInstallRoot(),
+    wowInstallRoot: paths.wowInstallRoot,
     enabledFlavors: ['_retail_'] as WowFlavor[],
-    localBackupDir: defaultLocalBackupDir(),
+    localBackupDir: paths.localBackupDir,
     retentionCount: 10,
     retentionMode: 'time-machine' as RetentionMode,
+    compressionLevel: 6,
+    copyConcurrency: 0,
     smb: {
       host: '',
       share: '',
       username: '',
       password: '',
-      mountPoint: defaultMountPoint(),
+      mountPoint: paths.mountPoint,
       autoMountOnLaunch: false,
       autoUploadAfterBackup: false
     },
-    schedule: {
-      enabled: false,
-      mode: 'interval',
-      intervalHours: 6,
-      dailyTime: '02:00',
-      cronExpression: ''
-    },
+    schedule: defaultSchedule(),
     autoSyncFromRemote: false,
     syncIntervalMinutes: 240,
     autoInstallSyncBackup: false,
@@ -63,8 +93,7 @@ export function defaultConfig(): AppConfig {
 }
 
 function sanitizeSchedule(raw: Partial<ScheduleConfig>): ScheduleConfig {
-  const base = defaultConfig().schedule;
-  const merged: ScheduleConfig = { ...base, ...raw };
+  const merged: ScheduleConfig = { ...defaultSchedule(), ...raw };
   if (!['interval', 'daily', 'custom'].includes(merged.mode)) {
     merged.mode = 'interval';
   }
@@ -96,6 +125,20 @@ function sanitize(raw: Partial<AppConfig>): AppConfig {
   if (!(['time-machine', 'count'] as RetentionMode[]).includes(merged.retentionMode)) {
     merged.retentionMode = 'time-machine';
   }
+  if (
+    !Number.isInteger(merged.compressionLevel) ||
+    merged.compressionLevel < 0 ||
+    merged.compressionLevel > 9
+  ) {
+    merged.compressionLevel = 6;
+  }
+  if (
+    !Number.isInteger(merged.copyConcurrency) ||
+    merged.copyConcurrency < 0 ||
+    merged.copyConcurrency > 64
+  ) {
+    merged.copyConcurrency = 0;
+  }
   if (typeof merged.autoSyncFromRemote !== 'boolean') {
     merged.autoSyncFromRemote = false;
   }
@@ -117,28 +160,50 @@ function sanitize(raw: Partial<AppConfig>): AppConfig {
 }
 
 let cached: AppConfig | null = null;
+/** Exact text last read from / written to disk, so unchanged saves can be skipped. */
+let lastWritten: string | null = null;
 
 export function loadConfig(): AppConfig {
   if (cached) return cached;
-  const p = configPath();
   try {
-    if (fs.existsSync(p)) {
-      const raw = JSON.parse(fs.readFileSync(p, 'utf-8')) as Partial<AppConfig>;
-      cached = sanitize(raw);
-      return cached;
-    }
+    const text = fs.readFileSync(configPath(), 'utf-8');
+    const raw = JSON.parse(text) as Partial<AppConfig>;
+    cached = sanitize(raw);
+    lastWritten = text;
+    return cached;
   } catch (err) {
-    console.error('Failed to read config; using defaults.', err);
+    // A missing file is just a first launch; anything else is worth logging.
+    if ((err as NodeJS.ErrnoException).code !== 'ENOENT') {
+      console.error('Failed to read config; using defaults.', err);
+    }
   }
   cached = defaultConfig();
   saveConfig(cached);
   return cached;
 }
 
+/** Write via a temp file + rename so a crash mid-write never leaves a truncated config. */
+function writeConfigFile(text: string): void {
+  const p = configPath();
+  const tmp = `${p}.tmp`;
+  fs.mkdirSync(path.dirname(p), { recursive: true });
+  fs.writeFileSync(tmp, text, 'utf-8');
+  try {
+    fs.renameSync(tmp, p);
+  } catch {
+    // Windows can refuse to replace a file another process has open.
+    fs.writeFileSync(p, text, 'utf-8');
+    fs.rmSync(tmp, { force: true });
+  }
+}
+
 export function saveConfig(cfg: AppConfig): AppConfig {
   const clean = sanitize(cfg);
-  fs.mkdirSync(path.dirname(configPath()), { recursive: true });
-  fs.writeFileSync(configPath(), JSON.stringify(clean, null, 2), 'utf-8');
+  const text = JSON.stringify(clean, null, 2);
+  if (text !== lastWritten) {
+    writeConfigFile(text);
+    lastWritten = text;
+  }
   cached = clean;
   return clean;
 }
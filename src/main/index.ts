@@ -5,9 +5,15 @@ import fs from 'node:fs';
 import { loadConfig, patchConfig } from './config';
 import { listBackupsWithMeta, runBackup } from './backup';
 import { mountShare, mountStatus, unmountShare } from './smb';
-import { downloadBackup, getRemoteMeta, listRemote, uploadBackup } from './remote';
-import { restoreFromZip } from './restore';
-import { rebuildIndex } from './metadata';
+import {
+  downloadBackup,
+  getRemoteMeta,
+  listRemote,
+  listRemoteNames,
+  uploadBackup
+} from './remote';
+import { restoreFromZip, sweepStaleStagingDirs } from './restore';
+import { forgetLocalMeta, rebuildIndex } from './metadata';
 import { startScheduler, updateScheduler, getSchedulerStatus, runScheduledBackupNow } from './scheduler';
 import { checkRemoteSync, applySyncBackup, dismissSyncBackup } from './sync';
 import { listJobs, recordJobRun, setJobEnabled, setJobNextRun } from './jobs';
@@ -117,13 +123,22 @@ async function createWindow(): Promise<void> {
 function registerIpc(): void {
   ipcMain.handle('config:get', () => loadConfig());
   ipcMain.handle('config:set', (_e, patch: Partial<AppConfig>) => {
+    const prev = loadConfig();
     const cfg = patchConfig(patch);
-    // Restart/stop the scheduler whenever settings change
-    updateScheduler();
+    // Only restart what actually changed — e.g. a theme toggle must not
+    // re-arm the scheduler (which would also re-run its catch-up check).
+    if (JSON.stringify(prev.schedule) !== JSON.stringify(cfg.schedule)) {
+      updateScheduler();
+    }
     // Restart the sync timer so interval changes take effect immediately
-    restartRemoteSyncTimer();
+    if (
+      prev.autoSyncFromRemote !== cfg.autoSyncFromRemote ||
+      prev.syncIntervalMinutes !== cfg.syncIntervalMinutes
+    ) {
+      restartRemoteSyncTimer();
+    }
     // Re-apply theme so vibrancy + renderer palette pick up preference changes.
-    applyTheme(cfg.theme);
+    if (prev.theme !== cfg.theme) applyTheme(cfg.theme);
     return cfg;
   });
 
@@ -173,9 +188,8 @@ function registerIpc(): void {
   });
   ipcMain.handle('backup:listLocal', () => {
     const cfg = loadConfig();
-    if (!fs.existsSync(cfg.localBackupDir)) {
-      fs.mkdirSync(cfg.localBackupDir, { recursive: true });
-    }
+    // recursive mkdir is a no-op when the folder already exists.
+    fs.mkdirSync(cfg.localBackupDir, { recursive: true });
     return listBackupsWithMeta(cfg.localBackupDir);
   });
   ipcMain.handle('backup:delete', async (_e, absPath: string) => {
@@ -185,10 +199,9 @@ function registerIpc(): void {
       throw new Error('Refusing to delete file outside backup directory.');
     }
     await fs.promises.unlink(resolved);
-    const sidecar = `${resolved}.meta.json`;
-    if (fs.existsSync(sidecar)) {
-      await fs.promises.unlink(sidecar).catch(() => {});
-    }
+    forgetLocalMeta(resolved);
+    // Missing sidecar is fine; the unlink error is ignored either way.
+    await fs.promises.unlink(`${resolved}.meta.json`).catch(() => {});
   });
 
   ipcMain.handle('smb:mount', () => mountShare());
@@ -196,6 +209,7 @@ function registerIpc(): void {
   ipcMain.handle('smb:status', () => mountStatus());
 
   ipcMain.handle('remote:list', () => listRemote());
+  ipcMain.handle('remote:listNames', () => listRemoteNames());
   ipcMain.handle('remote:upload', (_e, absPath: string) =>
     uploadBackup(absPath)
   );
@@ -441,6 +455,12 @@ app.whenReady().then(async () => {
     }
   }
 
+  // Clear staging left in the WoW folder by an interrupted restore. Runs in
+  // the background; staging folders of restores started since are skipped.
+  sweepStaleStagingDirs().catch((err) =>
+    console.warn('Restore staging sweep failed:', err)
+  );
+
   // Start the scheduled backup timer if enabled
   startScheduler();
 
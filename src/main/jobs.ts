@@ -31,11 +31,23 @@ function init(id: JobId): JobInternal {
   return j;
 }
 
+let broadcastPending = false;
+
+/**
+ * Schedule a `jobs:updated` broadcast. Updates usually arrive in bursts
+ * (e.g. enabled + next-run set back to back), so they are coalesced into a
+ * single snapshot sent on the next tick.
+ */
 function broadcast(): void {
-  const snapshot = listJobs();
-  for (const w of BrowserWindow.getAllWindows()) {
-    if (!w.isDestroyed()) w.webContents.send('jobs:updated', snapshot);
-  }
+  if (broadcastPending) return;
+  broadcastPending = true;
+  setImmediate(() => {
+    broadcastPending = false;
+    const snapshot = listJobs();
+    for (const w of BrowserWindow.getAllWindows()) {
+      if (!w.isDestroyed()) w.webContents.send('jobs:updated', snapshot);
+    }
+  });
 }
 
 /** Mark a job as enabled/disabled (whether its timer is currently active). */
@@ -65,9 +77,10 @@ export function recordJobRun(
   broadcast();
 }
 
+// Always return a stable, predictable order for the UI.
+const JOB_ORDER: readonly JobId[] = ['scheduler', 'sync-poll', 'updater-check', 'auto-mount'];
+
 /** Returns a snapshot of all known jobs. */
 export function listJobs(): JobStatus[] {
-  // Always return a stable, predictable order for the UI.
-  const order: JobId[] = ['scheduler', 'sync-poll', 'updater-check', 'auto-mount'];
-  return order.map((id) => ({ ...init(id) }));
+  return JOB_ORDER.map((id) => ({ ...init(id) }));
 }
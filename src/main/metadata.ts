@@ -10,6 +10,7 @@ import type {
   WowFlavor
 } from '../shared/types';
 import { WOW_FLAVORS } from '../shared/types';
+import { IO_CONCURRENCY, mapWithConcurrency } from './concurrency';
 
 const INDEX_FILE = 'wow-backups-index.json';
 
@@ -112,19 +113,63 @@ export async function readMeta(
   }
 }
 
+/**
+ * Parsed local sidecars, least recently used first. The Backups view
+ * re-lists the same files on every refresh; a local stat is enough to tell
+ * whether the cached copy is still current. Not used for the share, where
+ * the extra stat would be another network round trip.
+ */
+const LOCAL_META_CACHE_MAX = 256;
+const localMetaCache = new Map<string, { mtimeMs: number; size: number; meta: BackupMeta }>();
+
+/** readMeta for backups on local disk, served from a small cache. */
+export async function readLocalMeta(
+  zipAbsPath: string
+): Promise<BackupMeta | undefined> {
+  const p = metaPathFor(zipAbsPath);
+  try {
+    const stat = await fs.promises.stat(p);
+    const hit = localMetaCache.get(p);
+    localMetaCache.delete(p);
+    let meta: BackupMeta;
+    if (hit && hit.mtimeMs === stat.mtimeMs && hit.size === stat.size) {
+      meta = hit.meta;
+    } else {
+      meta = JSON.parse(await fs.promises.readFile(p, 'utf-8')) as BackupMeta;
+    }
+    // Re-insert to mark as most recently used; evict the oldest past the cap.
+    localMetaCache.set(p, { mtimeMs: stat.mtimeMs, size: stat.size, meta });
+    if (localMetaCache.size > LOCAL_META_CACHE_MAX) {
+      localMetaCache.delete(localMetaCache.keys().next().value as string);
+    }
+    // Callers may stamp fields, so hand out a copy.
+    return { ...meta };
+  } catch {
+    localMetaCache.delete(p);
+    return undefined;
+  }
+}
+
+/** Drop a deleted backup's sidecar from the local cache. */
+export function forgetLocalMeta(zipAbsPath: string): void {
+  localMetaCache.delete(metaPathFor(zipAbsPath));
+}
+
 /**
  * Copy a local meta sidecar to the remote dir, stamping uploadedAt.
- * If the local sidecar is missing, synthesize one from the zip.
+ * If the local sidecar is missing, synthesize one from the zip (pass
+ * `sha256` when the caller already hashed it, to skip re-reading the file).
  */
 export async function publishMeta(
   localZip: string,
   remoteZip: string,
-  opts: { wowInstallRoot: string }
+  opts: { wowInstallRoot: string; sha256?: string }
 ): Promise<BackupMeta> {
   let meta = await readMeta(localZip);
   if (!meta) {
     meta = await writeLocalMeta(localZip, {
-      wowInstallRoot: opts.wowInstallRoot
+      wowInstallRoot: opts.wowInstallRoot,
+      sha256: opts.sha256
     });
   }
   meta.uploadedAtIso = new Date().toISOString();
@@ -162,6 +207,18 @@ export async function writeIndex(
   );
 }
 
+/**
+ * Newest-first order for anything with a `createdAtIso`. The values are
+ * fixed-width UTC ISO strings, so a plain code-unit comparison already
+ * sorts chronologically; localeCompare's collation is unnecessary.
+ */
+export function byCreatedDesc(
+  a: { createdAtIso: string },
+  b: { createdAtIso: string }
+): number {
+  return a.createdAtIso < b.createdAtIso ? 1 : a.createdAtIso > b.createdAtIso ? -1 : 0;
+}
+
 export async function upsertIndexEntry(
   dir: string,
   meta: BackupMeta
@@ -170,7 +227,7 @@ export async function upsertIndexEntry(
   const filtered = idx.entries.filter((e) => e.file !== meta.file);
   filtered.push(meta);
   // Sort newest first.
-  filtered.sort((a, b) => b.createdAtIso.localeCompare(a.createdAtIso));
+  filtered.sort(byCreatedDesc);
   idx.entries = filtered;
   await writeIndex(dir, idx);
 }
@@ -188,14 +245,13 @@ export async function removeIndexEntry(
  * Rebuild an index by scanning a directory for .meta.json files.
  */
 export async function rebuildIndex(dir: string): Promise<RemoteIndex> {
-  const entries: BackupMeta[] = [];
-  const files = await fs.promises.readdir(dir).catch(() => []);
-  for (const f of files) {
-    if (!f.endsWith('.zip')) continue;
-    const meta = await readMeta(path.join(dir, f));
-    if (meta) entries.push(meta);
-  }
-  entries.sort((a, b) => b.createdAtIso.localeCompare(a.createdAtIso));
+  const files = await fs.promises.readdir(dir).catch(() => [] as string[]);
+  const zips = files.filter((f) => f.endsWith('.zip'));
+  const metas = await mapWithConcurrency(zips, IO_CONCURRENCY, (f) =>
+    readMeta(path.join(dir, f))
+  );
+  const entries = metas.filter((m): m is BackupMeta => m !== undefined);
+  entries.sort(byCreatedDesc);
   const idx: RemoteIndex = {
     schemaVersion: 1,
     updatedAtIso: new Date().toISOString(),
@@ -1,12 +1,54 @@
 import { BrowserWindow } from 'electron';
 import type { ProgressEvent } from '../shared/types';
 
-export function emitProgress(e: ProgressEvent): void {
+// Zip/copy loops can report many ticks per millisecond; the UI only needs
+// them at roughly display rate, so intermediate ticks are coalesced.
+const PROGRESS_FLUSH_MS = 33;
+
+/** Latest 'progress' tick per id, waiting for the next flush. */
+const pendingProgress = new Map<string, ProgressEvent>();
+let flushTimer: NodeJS.Timeout | null = null;
+
+function send(e: ProgressEvent): void {
   for (const w of BrowserWindow.getAllWindows()) {
     if (!w.isDestroyed()) w.webContents.send('progress', e);
   }
 }
 
+function flushPending(): void {
+  flushTimer = null;
+  const events = [...pendingProgress.values()];
+  pendingProgress.clear();
+  for (const e of events) send(e);
+}
+
+export function emitProgress(e: ProgressEvent): void {
+  if (e.phase === 'progress') {
+    pendingProgress.set(e.id, e);
+    if (!flushTimer) flushTimer = setTimeout(flushPending, PROGRESS_FLUSH_MS);
+    return;
+  }
+  // start/done/error go out immediately; drop any queued tick for the same
+  // id so it can't land after 'done' and make a finished task look active.
+  pendingProgress.delete(e.id);
+  send(e);
+}
+
+/**
+ * Gate for per-chunk / per-entry reporters: true only when `ratio` lands on a
+ * different whole percent than the last accepted call, so callers can skip
+ * building events (and message strings) that wouldn't move the bar.
+ */
+export function percentGate(): (ratio: number) => boolean {
+  let last = -1;
+  return (ratio) => {
+    const pct = Math.floor(ratio * 100);
+    if (pct === last) return false;
+    last = pct;
+    return true;
+  };
+}
+
 export function newProgressId(): string {
   return `p_${Date.now().toString(36)}_${Math.random().toString(36).slice(2, 8)}`;
 }
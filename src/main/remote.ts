@@ -1,17 +1,29 @@
+import crypto from 'node:crypto';
 import fs from 'node:fs';
 import path from 'node:path';
 import type { BackupFile } from '../shared/types';
 import { loadConfig } from './config';
-import { isBackupPathInProgress, listBackupsWithMeta } from './backup';
+import {
+  isBackupPathInProgress,
+  listBackupNamesIn,
+  listBackupsIn
+} from './backup';
+import { IO_CONCURRENCY, mapWithConcurrency } from './concurrency';
 import { mountStatus } from './smb';
-import { emitProgress, newProgressId } from './progress';
+import { emitProgress, newProgressId, percentGate } from './progress';
 import {
   metaPathFor,
   publishMeta,
+  readIndex,
   readMeta,
   upsertIndexEntry
 } from './metadata';
 
+// Larger chunks than the 64 KiB stream default: each read/write against the
+// SMB share is a network round trip, and every chunk also emits a progress event.
+const TRANSFER_CHUNK_BYTES = 1024 * 1024;
+const BYTES_PER_MB = 1024 * 1024;
+
 async function ensureRemoteReady(): Promise<string> {
   const status = await mountStatus();
   if (!status.mounted || !status.mountPath) {
@@ -24,33 +36,60 @@ async function ensureRemoteReady(): Promise<string> {
 
 export async function listRemote(): Promise<BackupFile[]> {
   const mp = await ensureRemoteReady();
-  return listBackupsWithMeta(mp);
+  const files = listBackupsIn(mp);
+  // The share index already holds every uploaded backup's metadata, so one
+  // read replaces a sidecar round-trip per file. Sidecars are only read for
+  // files the index doesn't know (or whose size no longer matches it).
+  const index = await readIndex(mp);
+  const indexed = new Map(index.entries.map((e) => [e.file, e]));
+  return mapWithConcurrency(files, IO_CONCURRENCY, async (b) => {
+    const hit = indexed.get(b.name);
+    const meta = hit && hit.sizeBytes === b.sizeBytes ? hit : await readMeta(b.path);
+    return { ...b, meta };
+  });
 }
 
+/**
+ * File names only: no stats, index or sidecar reads. Enough for "is this
+ * backup already uploaded?" checks.
+ */
+export async function listRemoteNames(): Promise<string[]> {
+  const mp = await ensureRemoteReady();
+  return listBackupNamesIn(mp);
+}
+
+/** Copies `src` to `dst` and returns the SHA-256 of the bytes copied. */
 async function copyWithProgress(
   src: string,
   dst: string,
   label: string
-): Promise<void> {
+): Promise<string> {
   const id = newProgressId();
   emitProgress({ id, phase: 'start', label });
   const stat = await fs.promises.stat(src);
-  const total = stat.size || 1;
+  // Per-chunk work is one multiply; the division happens once here.
+  const invTotal = 1 / (stat.size || 1);
   let copied = 0;
+  const shouldReport = percentGate();
+  // Hashed on the way through, so nothing needs to read the file again.
+  const hash = crypto.createHash('sha256');
 
   await fs.promises.mkdir(path.dirname(dst), { recursive: true });
 
   await new Promise<void>((resolve, reject) => {
-    const rs = fs.createReadStream(src);
-    const ws = fs.createWriteStream(dst);
+    const rs = fs.createReadStream(src, { highWaterMark: TRANSFER_CHUNK_BYTES });
+    const ws = fs.createWriteStream(dst, { highWaterMark: TRANSFER_CHUNK_BYTES });
     rs.on('data', (chunk) => {
+      hash.update(chunk);
       copied += (chunk as Buffer).length;
+      const ratio = Math.min(1, copied * invTotal);
+      if (!shouldReport(ratio)) return;
       emitProgress({
         id,
         phase: 'progress',
         label,
-        ratio: Math.min(1, copied / total),
-        message: `${Math.round(copied / 1024 / 1024)} MB`
+        ratio,
+        message: `${Math.round(copied / BYTES_PER_MB)} MB`
       });
     });
     rs.on('error', reject);
@@ -60,6 +99,7 @@ async function copyWithProgress(
   });
 
   emitProgress({ id, phase: 'done', label, ratio: 1 });
+  return hash.digest('hex');
 }
 
 async function copySmall(src: string, dst: string): Promise<void> {
@@ -82,15 +122,16 @@ export async function uploadBackup(absLocalPath: string): Promise<void> {
   const dst = path.join(mp, fileName);
 
   let copiedZip = false;
+  let sha256: string | undefined;
   if (fs.existsSync(dst)) {
     const a = fs.statSync(absLocalPath);
     const b = fs.statSync(dst);
     if (a.size !== b.size) {
-      await copyWithProgress(absLocalPath, dst, `Uploading ${fileName}`);
+      sha256 = await copyWithProgress(absLocalPath, dst, `Uploading ${fileName}`);
       copiedZip = true;
     }
   } else {
-    await copyWithProgress(absLocalPath, dst, `Uploading ${fileName}`);
+    sha256 = await copyWithProgress(absLocalPath, dst, `Uploading ${fileName}`);
     copiedZip = true;
   }
 
@@ -98,7 +139,8 @@ export async function uploadBackup(absLocalPath: string): Promise<void> {
   // stays in sync even if the zip itself was already there.
   try {
     const meta = await publishMeta(absLocalPath, dst, {
-      wowInstallRoot: cfg.wowInstallRoot
+      wowInstallRoot: cfg.wowInstallRoot,
+      sha256
     });
     await upsertIndexEntry(mp, meta);
   } catch (err) {
@@ -119,7 +161,14 @@ export async function downloadBackup(remoteName: string): Promise<string> {
   }
   const dst = path.join(cfg.localBackupDir, remoteName);
   await fs.promises.mkdir(cfg.localBackupDir, { recursive: true });
-  await copyWithProgress(src, dst, `Downloading ${remoteName}`);
+  const expected = await readMeta(src);
+  const sha256 = await copyWithProgress(src, dst, `Downloading ${remoteName}`);
+  // The digest comes free with the copy; a mismatch with the sidecar means a
+  // truncated or corrupted transfer, which must not be restored.
+  if (expected?.sha256 && expected.sha256 !== sha256) {
+    await fs.promises.unlink(dst).catch(() => {});
+    throw new Error(`Downloaded ${remoteName} does not match its checksum; try again.`);
+  }
 
   // Also fetch the sidecar so the local listing shows source machine info.
   const remoteMeta = metaPathFor(src);
@@ -1,11 +1,22 @@
-import extractZip from 'extract-zip';
 import fs from 'node:fs';
 import path from 'node:path';
 import os from 'node:os';
 import type { WowFlavor } from '../shared/types';
 import { WOW_FLAVORS } from '../shared/types';
+import { rmdirTree } from './backup';
 import { loadConfig } from './config';
-import { emitProgress, newProgressId } from './progress';
+import { emitProgress, newProgressId, percentGate } from './progress';
+import { mapWithConcurrency } from './concurrency';
+import { extractZip } from './unzip';
+
+// Small-file copies are latency-bound; keep a few dozen in flight, but scale
+// down on low-core machines where that many just queue and raise latency.
+// AppConfig.copyConcurrency overrides it.
+const RESTORE_COPY_CONCURRENCY = Math.min(32, os.availableParallelism() * 4);
+/** Hidden staging folder created beside the live AddOns/WTF during a restore. */
+const STAGING_PREFIX = '.wowrestore-';
+/** Staging folders this process created and hasn't removed yet. */
+const ownStagingDirs = new Set<string>();
 
 function inferFlavorFromName(name: string): WowFlavor | null {
   const m = name.match(/^wow-addons_(.+?)_\d{4}-\d{2}-\d{2}_/);
@@ -14,13 +25,154 @@ function inferFlavorFromName(name: string): WowFlavor | null {
   return (WOW_FLAVORS as string[]).includes(f) ? (f as WowFlavor) : null;
 }
 
-async function safeReplace(src: string, dst: string): Promise<void> {
-  if (fs.existsSync(dst)) {
-    const backup = `${dst}.bak_${Date.now()}`;
-    await fs.promises.rename(dst, backup);
+/**
+ * Copy a directory tree with several files in flight at once. fs.cp walks
+ * and copies one file at a time, which leaves the disk idle between the
+ * thousands of small files a typical AddOns folder is made of.
+ */
+async function copyTree(src: string, dst: string, limit: number): Promise<void> {
+  const files: Array<{ from: string; to: string; link: boolean }> = [];
+
+  // One walk: create every directory up front and collect the files.
+  async function walk(from: string, to: string): Promise<void> {
+    await fs.promises.mkdir(to, { recursive: true });
+    const entries = await fs.promises.readdir(from, { withFileTypes: true });
+    const subdirs: Promise<void>[] = [];
+    for (const entry of entries) {
+      const child = { from: path.join(from, entry.name), to: path.join(to, entry.name) };
+      if (entry.isDirectory()) {
+        subdirs.push(walk(child.from, child.to));
+      } else {
+        files.push({ ...child, link: entry.isSymbolicLink() });
+      }
+    }
+    // Let sibling walks settle before failing, so nothing is still creating
+    // folders under dst when the caller rolls back.
+    const settled = await Promise.allSettled(subdirs);
+    const failed = settled.find((r): r is PromiseRejectedResult => r.status === 'rejected');
+    if (failed) throw failed.reason;
+  }
+  await walk(src, dst);
+
+  await mapWithConcurrency(files, limit, async (f) => {
+    if (f.link) {
+      // Recreate links as links, as fs.cp does, rather than copying targets.
+      await fs.promises.symlink(await fs.promises.readlink(f.from), f.to);
+      return;
+    }
+    // FICLONE asks for a copy-on-write clone (APFS, Btrfs, XFS, ReFS) and
+    // silently falls back to a regular kernel-side copy where unsupported.
+    await fs.promises.copyFile(f.from, f.to, fs.constants.COPYFILE_FICLONE);
+  });
+}
+
+// Windows reports a folder held open by antivirus or the indexer as
+// EPERM/EACCES/EBUSY; those handles usually go away within a second.
+const RENAME_RETRY_CODES = new Set(['EPERM', 'EACCES', 'EBUSY']);
+const RENAME_RETRY_DELAYS_MS = [100, 250, 500];
+
+async function renameWithRetry(from: string, to: string): Promise<void> {
+  for (let attempt = 0; ; attempt++) {
+    try {
+      await fs.promises.rename(from, to);
+      return;
+    } catch (err) {
+      const code = (err as NodeJS.ErrnoException).code ?? '';
+      if (attempt >= RENAME_RETRY_DELAYS_MS.length || !RENAME_RETRY_CODES.has(code)) {
+        throw err;
+      }
+      await new Promise((r) => setTimeout(r, RENAME_RETRY_DELAYS_MS[attempt]));
+    }
   }
+}
+
+async function safeReplace(src: string, dst: string, copyLimit: number): Promise<void> {
   await fs.promises.mkdir(path.dirname(dst), { recursive: true });
-  await fs.promises.cp(src, dst, { recursive: true });
+  let stashed: string | null = null;
+  if (fs.existsSync(dst)) {
+    stashed = `${dst}.bak_${Date.now()}`;
+    await renameWithRetry(dst, stashed);
+  }
+  try {
+    // Same volume: a rename is a metadata-only move, whatever the tree size.
+    try {
+      await renameWithRetry(src, dst);
+      return;
+    } catch {
+      // EXDEV, or a handle that outlived the retries: copy instead.
+    }
+    await copyTree(src, dst, copyLimit);
+  } catch (err) {
+    // Never leave the game without the folder: put the original back. copyTree
+    // only rejects once every copy has settled, so dst is no longer changing.
+    if (stashed) {
+      await rmdirTree(dst).catch(() => {});
+      try {
+        await renameWithRetry(stashed, dst);
+      } catch (restoreErr) {
+        console.error(`Failed to move ${stashed} back to ${dst}:`, restoreErr);
+        throw new Error(
+          `${(err as Error).message}. Your previous folder could not be put back ` +
+            `and is kept at ${stashed}; rename it to ${path.basename(dst)} to recover.`
+        );
+      }
+    }
+    throw err;
+  }
+}
+
+/**
+ * Staging folder for extraction. Prefer one beside the destination so
+ * safeReplace can rename instead of copy; the OS temp dir is usually on a
+ * different volume. Falls back to it if the install folder isn't writable.
+ */
+async function makeStagingDir(flavorRoot: string): Promise<string> {
+  let dir: string;
+  try {
+    dir = await fs.promises.mkdtemp(path.join(flavorRoot, STAGING_PREFIX));
+  } catch {
+    dir = await fs.promises.mkdtemp(path.join(os.tmpdir(), 'wowrestore-'));
+  }
+  ownStagingDirs.add(dir);
+  return dir;
+}
+
+async function removeStagingDir(dir: string): Promise<void> {
+  try {
+    await rmdirTree(dir);
+  } catch (err) {
+    console.warn('Failed to remove restore staging folder:', dir, err);
+  } finally {
+    ownStagingDirs.delete(dir);
+  }
+}
+
+/**
+ * Remove staging folders left in the WoW install by a restore that never
+ * finished (crash, power loss). Unlike the OS temp dir, nothing else would
+ * ever clean them up. Runs in the background at startup, so folders this
+ * process created (a restore already in progress) are skipped.
+ */
+export async function sweepStaleStagingDirs(): Promise<void> {
+  const cfg = loadConfig();
+  await Promise.all(
+    WOW_FLAVORS.map(async (flavor) => {
+      const flavorRoot = path.join(cfg.wowInstallRoot, flavor);
+      let names: string[];
+      try {
+        names = await fs.promises.readdir(flavorRoot);
+      } catch {
+        return; // Flavor not installed.
+      }
+      for (const name of names) {
+        const dir = path.join(flavorRoot, name);
+        if (!name.startsWith(STAGING_PREFIX) || ownStagingDirs.has(dir)) continue;
+        await rmdirTree(dir).catch((err) =>
+          console.warn('Failed to remove stale restore staging folder:', name, err)
+        );
+      }
+    })
+  );
 }
 
 /**
@@ -30,7 +182,7 @@ async function safeReplace(src: string, dst: string): Promise<void> {
  *   <flavor>/AddOns/...
  *   <flavor>/WTF/...       (optional)
  *
- * We extract to a temp folder, then move AddOns -> <installRoot>/<flavor>/Interface/AddOns
+ * We extract to a staging folder, then move AddOns -> <installRoot>/<flavor>/Interface/AddOns
  * and WTF -> <installRoot>/<flavor>/WTF (replacing existing, stashing old as .bak_<ts>).
  */
 export async function restoreFromZip(absZipPath: string): Promise<void> {
@@ -55,21 +207,22 @@ export async function restoreFromZip(absZipPath: string): Promise<void> {
   const label = `Restoring ${path.basename(absZipPath)}`;
   emitProgress({ id, phase: 'start', label });
 
-  const tmp = await fs.promises.mkdtemp(
-    path.join(os.tmpdir(), 'wowrestore-')
-  );
+  const tmp = await makeStagingDir(flavorRoot);
   try {
+    const shouldReport = percentGate();
+    // total is fixed for the whole extraction; divide once, multiply per entry.
+    let invTotal: number | null = null;
     await extractZip(absZipPath, {
       dir: tmp,
-      onEntry: (entry, zipfile) => {
-        const total = zipfile.entryCount || 1;
-        // entriesRead may be undefined in older versions; fall back.
-        const done = (zipfile as unknown as { entriesRead?: number }).entriesRead ?? 0;
+      onEntry: (entry, done, total) => {
+        invTotal ??= 1 / (total || 1);
+        const ratio = Math.min(1, done * invTotal);
+        if (!shouldReport(ratio)) return;
         emitProgress({
           id,
           phase: 'progress',
           label,
-          ratio: Math.min(1, done / total),
+          ratio,
           message: entry.fileName
         });
       }
@@ -79,20 +232,28 @@ export async function restoreFromZip(absZipPath: string): Promise<void> {
     const entries = await fs.promises.readdir(tmp);
     const topLevel = entries.length === 1 ? path.join(tmp, entries[0]) : tmp;
 
+    const copyLimit = cfg.copyConcurrency || RESTORE_COPY_CONCURRENCY;
     const srcAddons = path.join(topLevel, 'AddOns');
     const srcWtf = path.join(topLevel, 'WTF');
 
     if (fs.existsSync(srcAddons)) {
       const dstAddons = path.join(flavorRoot, 'Interface', 'AddOns');
-      await safeReplace(srcAddons, dstAddons);
+      await safeReplace(srcAddons, dstAddons, copyLimit);
     }
     if (fs.existsSync(srcWtf)) {
       const dstWtf = path.join(flavorRoot, 'WTF');
-      await safeReplace(srcWtf, dstWtf);
+      await safeReplace(srcWtf, dstWtf, copyLimit);
     }
 
     emitProgress({ id, phase: 'done', label, ratio: 1 });
+    // Not awaited: after a copy fallback the staging tree can hold thousands
+    // of files, and the restore is already complete. extractZip and
+    // safeReplace have settled, so nothing is still writing into it.
+    void removeStagingDir(tmp);
   } catch (err) {
+    // Awaited, so a failed restore doesn't report back while its staging
+    // folder is still being torn down inside the WoW install.
+    await removeStagingDir(tmp);
     emitProgress({
       id,
       phase: 'error',
@@ -100,7 +261,5 @@ export async function restoreFromZip(absZipPath: string): Promise<void> {
       message: (err as Error).message
     });
     throw err;
-  } finally {
-    await fs.promises.rm(tmp, { recursive: true, force: true }).catch(() => {});
   }
 }
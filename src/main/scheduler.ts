@@ -10,6 +10,9 @@ import { emitProgress } from './progress';
 import { recordJobRun, setJobEnabled, setJobNextRun } from './jobs';
 import type { ScheduleConfig, SchedulerStatus } from '../shared/types';
 
+const HOUR_MS = 60 * 60 * 1000;
+const DAY_MS = 24 * HOUR_MS;
+
 // ---------------------------------------------------------------------------
 // Persistent state
 // ---------------------------------------------------------------------------
@@ -18,8 +21,10 @@ interface SchedulerState {
   lastRunIso: string | null;
 }
 
+let resolvedStatePath: string | null = null;
 function stateFilePath(): string {
-  return path.join(app.getPath('userData'), 'scheduler-state.json');
+  resolvedStatePath ??= path.join(app.getPath('userData'), 'scheduler-state.json');
+  return resolvedStatePath;
 }
 
 function loadState(): SchedulerState {
@@ -31,12 +36,17 @@ function loadState(): SchedulerState {
   }
 }
 
+let pendingStateWrite: Promise<void> = Promise.resolve();
+
+/**
+ * Persist state off the main-process hot path. Writes are chained so they
+ * land in order and the most recent state always wins.
+ */
 function saveState(state: SchedulerState): void {
-  try {
-    fs.writeFileSync(stateFilePath(), JSON.stringify(state, null, 2), 'utf-8');
-  } catch (err) {
-    console.error('[scheduler] Failed to save state:', err);
-  }
+  const text = JSON.stringify(state, null, 2);
+  pendingStateWrite = pendingStateWrite
+    .then(() => fs.promises.writeFile(stateFilePath(), text, 'utf-8'))
+    .catch((err) => console.error('[scheduler] Failed to save state:', err));
 }
 
 // ---------------------------------------------------------------------------
@@ -88,8 +98,8 @@ export function scheduleToCron(schedule: ScheduleConfig): string | null {
  */
 function expectedIntervalMs(schedule: ScheduleConfig): number | null {
   switch (schedule.mode) {
-    case 'interval': return schedule.intervalHours * 3600 * 1000;
-    case 'daily':    return 24 * 3600 * 1000;
+    case 'interval': return schedule.intervalHours * HOUR_MS;
+    case 'daily':    return DAY_MS;
     case 'custom':   return null;
   }
 }
@@ -278,9 +288,11 @@ export function startScheduler(): void {
     return;
   }
 
-  // Restore persisted state so lastRunIso survives app restarts
-  const state = loadState();
-  lastRunIso = state.lastRunIso;
+  // Restore persisted state so lastRunIso survives app restarts. Only this
+  // process writes the file, so once loaded the in-memory value is current.
+  if (lastRunIso === null) {
+    lastRunIso = loadState().lastRunIso;
+  }
   currentCron = expr;
 
   console.log(`[scheduler] Starting schedule (${cfg.schedule.mode}): "${expr}"`);
@@ -368,6 +380,9 @@ export function updateScheduler(): void {
     stopScheduler();
     return;
   }
+  // The cron expression is all the running task depends on. Edits that don't
+  // change it (e.g. dailyTime while in interval mode) keep the task as is.
+  if (task && currentCron === scheduleToCron(cfg.schedule)) return;
   startScheduler();
 }
 
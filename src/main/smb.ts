@@ -1,11 +1,39 @@
-import { exec } from 'node:child_process';
+import { BrowserWindow } from 'electron';
+import { execFile } from 'node:child_process';
 import fs from 'node:fs';
 import path from 'node:path';
 import { promisify } from 'node:util';
 import type { MountStatus } from '../shared/types';
 import { loadConfig } from './config';
 
-const execP = promisify(exec);
+// execFile runs the binary directly: no intermediate shell per call, and
+// arguments need no quoting.
+const execFileP = promisify(execFile);
+
+/**
+ * Shared options for every child process we spawn: never flash a console
+ * window on Windows (no-op elsewhere). Built once; callers must not mutate it.
+ */
+const EXEC_OPTS: Readonly<{ windowsHide: boolean }> = Object.freeze({
+  windowsHide: true
+});
+
+// Absolute paths where the location is fixed, so each spawn skips the PATH
+// search (and can't pick up a shadowing binary). Linux distros differ on
+// /bin vs /usr/bin, so there the name is left to PATH.
+const MOUNT_BIN = process.platform === 'darwin' ? '/sbin/mount' : 'mount';
+const UMOUNT_BIN = process.platform === 'darwin' ? '/sbin/umount' : 'umount';
+const NET_BIN =
+  process.platform === 'win32'
+    ? path.join(process.env.SystemRoot ?? 'C:\\Windows', 'System32', 'net.exe')
+    : 'net';
+
+/** Captures the mount path after " on " in a `mount` output line. */
+const MOUNT_ON_RE = / on (.+?) (?:\(|type )/;
+
+function escapeRegExp(s: string): string {
+  return s.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+}
 
 function encodeForUrl(s: string): string {
   return encodeURIComponent(s).replace(/%2F/g, '/');
@@ -25,27 +53,74 @@ export function resolvedMountPoint(): string | undefined {
  * Linux CIFS lines look like:
  *   //192.168.0.15/NasBackup/WoWAddonBackup on /mnt/wowbackups type cifs (...)
  */
+function findShareMountIn(
+  mountOutput: string,
+  host: string,
+  share: string
+): string | undefined {
+  // One case-insensitive matcher instead of lowercasing every line.
+  const needle = new RegExp(escapeRegExp(`${host}/${share}`), 'i');
+  for (const line of mountOutput.split('\n')) {
+    if (!needle.test(line)) continue;
+    const m = MOUNT_ON_RE.exec(line);
+    if (m) return m[1];
+  }
+  return undefined;
+}
+
 async function findExistingShareMount(
   host: string,
   share: string
 ): Promise<string | undefined> {
   try {
-    const { stdout } = await execP('mount');
-    const needle = `${host}/${share}`.toLowerCase();
-    for (const line of stdout.split('\n')) {
-      const lower = line.toLowerCase();
-      if (!lower.includes(needle)) continue;
-      // Extract the path after " on "
-      const m = line.match(/ on (.+?) (?:\(|type )/);
-      if (m) return m[1];
-    }
+    const { stdout } = await execFileP(MOUNT_BIN, [], EXEC_OPTS);
+    return findShareMountIn(stdout, host, share);
   } catch {
-    // ignore
+    return undefined;
   }
-  return undefined;
 }
 
-export async function mountStatus(): Promise<MountStatus> {
+// ---------------------------------------------------------------------------
+// Mount status probe
+//
+// The renderer polls this and every remote list/upload/download re-checks it
+// first, so one probe is shared by all callers for a short window (and by
+// concurrent callers while it is still running). mount/unmount invalidate it.
+// ---------------------------------------------------------------------------
+const MOUNT_STATUS_TTL_MS = 2000;
+let statusCache: { key: string; at: number; value: Promise<MountStatus> } | null = null;
+
+function invalidateMountStatus(): void {
+  statusCache = null;
+}
+
+export function mountStatus(): Promise<MountStatus> {
+  const { smb } = loadConfig();
+  // Keyed on the settings so an edit in Settings is picked up immediately.
+  const key = `${smb.host}|${smb.share}|${smb.mountPoint}`;
+  const now = Date.now();
+  if (statusCache && statusCache.key === key && now - statusCache.at < MOUNT_STATUS_TTL_MS) {
+    return statusCache.value;
+  }
+  const value = probeMountStatus();
+  statusCache = { key, at: now, value };
+  void value.then(broadcastIfChanged);
+  return value;
+}
+
+// Push mount changes (including ones made by the tray, scheduler or sync
+// auto-mount) to the renderer, so it doesn't have to poll to notice them.
+let lastBroadcast = '';
+function broadcastIfChanged(status: MountStatus): void {
+  const serialized = JSON.stringify(status);
+  if (serialized === lastBroadcast) return;
+  lastBroadcast = serialized;
+  for (const w of BrowserWindow.getAllWindows()) {
+    if (!w.isDestroyed()) w.webContents.send('smb:statusChanged', status);
+  }
+}
+
+async function probeMountStatus(): Promise<MountStatus> {
   const { smb } = loadConfig();
   if (!smb.host || !smb.share) {
     return { mounted: false, message: 'SMB host/share not configured.' };
@@ -55,11 +130,13 @@ export async function mountStatus(): Promise<MountStatus> {
 
   try {
     if (process.platform === 'darwin' || process.platform === 'linux') {
+      // One `mount` listing answers both questions below.
+      const { stdout } = await execFileP(MOUNT_BIN, [], EXEC_OPTS);
+
       // First, accept a mount anywhere for this host+share.
-      const existing = await findExistingShareMount(smb.host, smb.share);
+      const existing = findShareMountIn(stdout, smb.host, smb.share);
       if (existing) return { mounted: true, mountPath: existing };
 
-      const { stdout } = await execP('mount');
       const mounted = stdout
         .split('\n')
         .some((line) => line.includes(` on ${mp} `));
@@ -82,6 +159,24 @@ export async function mountStatus(): Promise<MountStatus> {
 }
 
 export async function mountShare(): Promise<MountStatus> {
+  try {
+    return await performMount();
+  } finally {
+    invalidateMountStatus();
+    void mountStatus();
+  }
+}
+
+export async function unmountShare(): Promise<MountStatus> {
+  try {
+    return await performUnmount();
+  } finally {
+    invalidateMountStatus();
+    void mountStatus();
+  }
+}
+
+async function performMount(): Promise<MountStatus> {
   const { smb } = loadConfig();
   if (!smb.host || !smb.share) {
     return { mounted: false, message: 'SMB host/share not configured.' };
@@ -119,7 +214,7 @@ export async function mountShare(): Promise<MountStatus> {
             : '';
       const url = `//${auth}${smb.host}/${smb.share}`;
       try {
-        await execP(`/sbin/mount_smbfs "${url}" "${target}"`);
+        await execFileP('/sbin/mount_smbfs', [url, target], EXEC_OPTS);
       } catch (err) {
         const e = err as { stderr?: string; message: string };
         const detail = (e.stderr || e.message).trim();
@@ -138,20 +233,19 @@ export async function mountShare(): Promise<MountStatus> {
       const opts: string[] = [];
       if (smb.username) opts.push(`username=${smb.username}`);
       if (smb.password) opts.push(`password=${smb.password}`);
-      const optStr = opts.length ? `-o ${opts.join(',')}` : '';
-      await execP(
-        `mount -t cifs "//${smb.host}/${smb.share}" "${mp}" ${optStr}`.trim()
-      );
+      const args = ['-t', 'cifs', `//${smb.host}/${smb.share}`, mp];
+      if (opts.length) args.push('-o', opts.join(','));
+      await execFileP(MOUNT_BIN, args, EXEC_OPTS);
       return { mounted: true, mountPath: mp };
     }
 
     if (process.platform === 'win32') {
       const drive = mp.replace(/\\+$/, '');
-      const userArg = smb.username ? `/user:${smb.username}` : '';
-      const passArg = smb.password ? `"${smb.password}"` : '';
-      const cmd =
-        `net use ${drive} \\\\${smb.host}\\${smb.share} ${passArg} ${userArg} /persistent:no`.trim();
-      await execP(cmd, { windowsHide: true });
+      const args = ['use', drive, `\\\\${smb.host}\\${smb.share}`];
+      if (smb.password) args.push(smb.password);
+      if (smb.username) args.push(`/user:${smb.username}`);
+      args.push('/persistent:no');
+      await execFileP(NET_BIN, args, EXEC_OPTS);
       return { mounted: true, mountPath: drive };
     }
   } catch (err) {
@@ -160,17 +254,17 @@ export async function mountShare(): Promise<MountStatus> {
   return { mounted: false, message: 'Unsupported platform' };
 }
 
-export async function unmountShare(): Promise<MountStatus> {
+async function performUnmount(): Promise<MountStatus> {
   const mp = resolvedMountPoint();
   if (!mp) return { mounted: false, message: 'No mount point set.' };
   try {
     if (process.platform === 'darwin' || process.platform === 'linux') {
-      await execP(`umount "${mp}"`);
+      await execFileP(UMOUNT_BIN, [mp], EXEC_OPTS);
       return { mounted: false, message: `Unmounted ${mp}` };
     }
     if (process.platform === 'win32') {
       const drive = mp.replace(/\\+$/, '');
-      await execP(`net use ${drive} /delete /y`, { windowsHide: true });
+      await execFileP(NET_BIN, ['use', drive, '/delete', '/y'], EXEC_OPTS);
       return { mounted: false, message: `Unmounted ${drive}` };
     }
   } catch (err) {
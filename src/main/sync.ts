@@ -12,7 +12,7 @@ import { loadConfig } from './config';
 import { listRemote, downloadBackup } from './remote';
 import { restoreFromZip } from './restore';
 import { mountStatus, mountShare } from './smb';
-import type { SyncAvailableInfo, WowFlavor } from '../shared/types';
+import type { BackupFile, SyncAvailableInfo, WowFlavor } from '../shared/types';
 
 // ---------------------------------------------------------------------------
 // Sync state — persisted so we don't re-notify about the same backup
@@ -23,24 +23,34 @@ const STATE_FILE = 'sync-state.json';
 /** Map of flavor -> ISO timestamp of the last remote backup we applied/dismissed. */
 type SyncState = Partial<Record<WowFlavor, string>>;
 
+let resolvedStatePath: string | null = null;
 function statePath(): string {
-  return path.join(app.getPath('userData'), STATE_FILE);
+  resolvedStatePath ??= path.join(app.getPath('userData'), STATE_FILE);
+  return resolvedStatePath;
 }
 
+// Only this process writes the state file, so it is parsed once and then
+// served from memory.
+let cachedState: SyncState | null = null;
+let pendingStateWrite: Promise<void> = Promise.resolve();
+
 function loadSyncState(): SyncState {
+  if (cachedState) return cachedState;
+  cachedState = {};
   try {
-    const p = statePath();
-    if (fs.existsSync(p)) {
-      return JSON.parse(fs.readFileSync(p, 'utf-8')) as SyncState;
-    }
+    cachedState = JSON.parse(fs.readFileSync(statePath(), 'utf-8')) as SyncState;
   } catch {
-    // Ignore parse errors; start fresh.
+    // Missing or unparsable; start fresh.
   }
-  return {};
+  return cachedState;
 }
 
 function saveSyncState(state: SyncState): void {
-  fs.writeFileSync(statePath(), JSON.stringify(state, null, 2), 'utf-8');
+  cachedState = state;
+  const text = JSON.stringify(state, null, 2);
+  pendingStateWrite = pendingStateWrite
+    .then(() => fs.promises.writeFile(statePath(), text, 'utf-8'))
+    .catch((err) => console.error('[sync] Failed to save state:', err));
 }
 
 // ---------------------------------------------------------------------------
@@ -78,25 +88,23 @@ export async function checkRemoteSync(): Promise<SyncAvailableInfo[]> {
 
   const currentHostname = os.hostname();
   const state = loadSyncState();
-  const available: SyncAvailableInfo[] = [];
+  const enabled = new Set<string>(cfg.enabledFlavors);
+
+  // One pass over the listing: newest backup from another machine per
+  // enabled flavor. createdAtIso is fixed-width UTC ISO, so `>` orders it.
+  const newestByFlavor = new Map<string, BackupFile>();
+  for (const f of remoteFiles) {
+    if (!enabled.has(f.flavor)) continue;
+    const host = f.meta?.source?.hostname;
+    if (host === undefined || host === currentHostname) continue;
+    const best = newestByFlavor.get(f.flavor);
+    if (!best || f.createdAtIso > best.createdAtIso) newestByFlavor.set(f.flavor, f);
+  }
 
+  const available: SyncAvailableInfo[] = [];
   for (const flavor of cfg.enabledFlavors) {
-    // Only consider backups from other machines for this flavor.
-    const candidates = remoteFiles.filter(
-      (f) =>
-        f.flavor === flavor &&
-        f.meta?.source?.hostname !== undefined &&
-        f.meta.source.hostname !== currentHostname
-    );
-
-    if (candidates.length === 0) continue;
-
-    // Find the most recent one.
-    candidates.sort(
-      (a, b) =>
-        new Date(b.createdAtIso).getTime() - new Date(a.createdAtIso).getTime()
-    );
-    const newest = candidates[0];
+    const newest = newestByFlavor.get(flavor);
+    if (!newest) continue;
 
     // Skip if we've already synced this timestamp (or something newer).
     const lastSynced = state[flavor];
@@ -9,13 +9,24 @@ import { uploadBackup } from './remote';
 // Minimal PNG generator (no external deps)
 // ---------------------------------------------------------------------------
 
+// Byte-at-a-time lookup table: one step per byte instead of eight. (zlib.crc32
+// only exists from Node 22.2; Electron 30 ships Node 20.)
+const CRC_TABLE = (() => {
+  const table = new Uint32Array(256);
+  for (let n = 0; n < 256; n++) {
+    let c = n;
+    for (let k = 0; k < 8; k++) {
+      c = (c & 1) ? (c >>> 1) ^ 0xedb88320 : c >>> 1;
+    }
+    table[n] = c >>> 0;
+  }
+  return table;
+})();
+
 function crc32(buf: Buffer): number {
   let crc = 0xffffffff;
   for (let i = 0; i < buf.length; i++) {
-    crc ^= buf[i];
-    for (let j = 0; j < 8; j++) {
-      crc = (crc & 1) ? (crc >>> 1) ^ 0xedb88320 : crc >>> 1;
-    }
+    crc = CRC_TABLE[(crc ^ buf[i]) & 0xff] ^ (crc >>> 8);
   }
   return (crc ^ 0xffffffff) >>> 0;
 }
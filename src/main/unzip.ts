@@ -0,0 +1,233 @@
+import fs from 'node:fs';
+import os from 'node:os';
+import path from 'node:path';
+import { pipeline } from 'node:stream/promises';
+import type { Readable } from 'node:stream';
+import type { Entry, ZipFile } from 'yauzl';
+
+/**
+ * Zip extraction with several entries in flight.
+ *
+ * extract-zip inflates and writes one entry at a time. yauzl reads the
+ * archive by offset (no shared cursor), so read streams for different
+ * entries can be open at once: while one entry waits on its file write,
+ * another is being inflated.
+ *
+ * Backups can come from other machines via sync, so entries are treated as
+ * untrusted: every folder is realpath-checked against the target, and
+ * symlinks are only created at the end, serially, pointing downwards.
+ */
+
+// Inflating is CPU work on the libuv pool; more entries than cores in flight
+// only interleave them.
+const DEFAULT_EXTRACT_CONCURRENCY = Math.min(8, os.availableParallelism());
+const S_IFMT = 0o170000;
+const S_IFLNK = 0o120000;
+const DRIVE_PREFIX_RE = /^[a-zA-Z]:/;
+
+export interface ExtractOptions {
+  /** Destination folder (created if missing). */
+  dir: string;
+  /** Entries extracted at once. */
+  concurrency?: number;
+  /** Called after each entry lands on disk. */
+  onEntry?: (entry: Entry, done: number, total: number) => void;
+}
+
+function openZip(
+  lib: typeof import('yauzl'),
+  zipPath: string
+): Promise<ZipFile> {
+  return new Promise((resolve, reject) => {
+    lib.open(zipPath, { lazyEntries: true, autoClose: false }, (err, zip) => {
+      if (err || !zip) reject(err ?? new Error(`Could not open ${zipPath}`));
+      else resolve(zip);
+    });
+  });
+}
+
+/**
+ * Walk the central directory with at most `limit` calls to `fn` in flight,
+ * reading the next entry only when a slot frees up, so the listing is never
+ * held in memory. Stops reading after the first failure and settles only
+ * once every started call has finished.
+ */
+function forEachEntry(
+  zip: ZipFile,
+  limit: number,
+  fn: (entry: Entry) => Promise<void>
+): Promise<void> {
+  return new Promise((resolve, reject) => {
+    let inFlight = 0;
+    let reading = false;
+    let ended = false;
+    let failure: { error: unknown } | null = null;
+
+    const settleIfIdle = (): void => {
+      if (inFlight > 0 || reading || !(ended || failure)) return;
+      if (failure) reject(failure.error);
+      else resolve();
+    };
+    const readNext = (): void => {
+      if (failure || ended || reading || inFlight >= limit) return;
+      reading = true;
+      zip.readEntry();
+    };
+
+    zip.on('entry', (entry: Entry) => {
+      reading = false;
+      inFlight++;
+      fn(entry)
+        .catch((error) => {
+          failure ??= { error };
+        })
+        .finally(() => {
+          inFlight--;
+          readNext();
+          settleIfIdle();
+        });
+      readNext();
+    });
+    zip.once('end', () => {
+      reading = false;
+      ended = true;
+      settleIfIdle();
+    });
+    zip.once('error', (error) => {
+      reading = false;
+      failure ??= { error };
+      settleIfIdle();
+    });
+    readNext();
+  });
+}
+
+function openEntryStream(zip: ZipFile, entry: Entry): Promise<Readable> {
+  return new Promise((resolve, reject) => {
+    zip.openReadStream(entry, (err, stream) => {
+      if (err || !stream) reject(err ?? new Error(`Could not read ${entry.fileName}`));
+      else resolve(stream);
+    });
+  });
+}
+
+async function readAll(stream: Readable): Promise<string> {
+  const chunks: Buffer[] = [];
+  for await (const chunk of stream) chunks.push(chunk as Buffer);
+  return Buffer.concat(chunks).toString('utf-8');
+}
+
+/** Directory entry: trailing slash, or a DOS-made entry with the directory attribute. */
+function isDirectoryEntry(entry: Entry): boolean {
+  if (entry.fileName.endsWith('/')) return true;
+  // Some Windows zippers omit the slash; extract-zip checks the same way.
+  return entry.versionMadeBy >> 8 === 0 && entry.externalFileAttributes === 16;
+}
+
+function isInside(root: string, p: string): boolean {
+  return p === root || p.startsWith(root + path.sep);
+}
+
+function hasParentSegment(p: string): boolean {
+  return p.split(/[\\/]/).includes('..');
+}
+
+export async function extractZip(zipPath: string, opts: ExtractOptions): Promise<void> {
+  // Loaded on first use, like the other zip libraries.
+  const lib = await import('yauzl');
+  const root = path.resolve(opts.dir);
+  await fs.promises.mkdir(root, { recursive: true });
+  const realRoot = await fs.promises.realpath(root);
+
+  const zip = await openZip(lib, zipPath);
+  try {
+    const total = zip.entryCount;
+    let done = 0;
+    // Thousands of entries share a handful of folders; create and check each
+    // folder once (concurrent entries share the same pending promise)
+    // instead of a recursive mkdir + realpath per file.
+    const madeDirs = new Map<string, Promise<void>>();
+    const ensureDir = (dir: string): Promise<void> => {
+      let pending = madeDirs.get(dir);
+      if (!pending) {
+        pending = (async () => {
+          await fs.promises.mkdir(dir, { recursive: true });
+          // Resolve links on disk so a folder can't be redirected outside
+          // the target, whatever the entry name looks like.
+          const real = await fs.promises.realpath(dir);
+          if (!isInside(realRoot, real)) {
+            throw new Error(`Refusing to extract outside target: ${dir}`);
+          }
+        })();
+        madeDirs.set(dir, pending);
+      }
+      return pending;
+    };
+    madeDirs.set(root, Promise.resolve());
+
+    const resolveEntry = (entry: Entry): string => {
+      const dest = path.resolve(root, entry.fileName);
+      // yauzl already rejects absolute and "../" names; belt and braces.
+      if (!isInside(root, dest) || hasParentSegment(entry.fileName)) {
+        throw new Error(`Refusing to extract outside target: ${entry.fileName}`);
+      }
+      return dest;
+    };
+    const report = (entry: Entry): void => {
+      done++;
+      opts.onEntry?.(entry, done, total);
+    };
+
+    // Links are queued and created last, one at a time, once every regular
+    // file is on disk: nothing written afterwards can follow a link from
+    // the archive. Backups rarely contain any.
+    const links: Entry[] = [];
+
+    await forEachEntry(
+      zip,
+      opts.concurrency ?? DEFAULT_EXTRACT_CONCURRENCY,
+      async (entry) => {
+        const mode = (entry.externalFileAttributes >>> 16) & 0xffff;
+        if ((mode & S_IFMT) === S_IFLNK) {
+          links.push(entry);
+          return;
+        }
+        const dest = resolveEntry(entry);
+        if (isDirectoryEntry(entry)) {
+          await ensureDir(dest);
+        } else {
+          await ensureDir(path.dirname(dest));
+          const stream = await openEntryStream(zip, entry);
+          const perms = mode & 0o777;
+          await pipeline(
+            stream,
+            fs.createWriteStream(dest, perms ? { mode: perms } : undefined)
+          );
+        }
+        report(entry);
+      }
+    );
+
+    for (const entry of links) {
+      const dest = resolveEntry(entry);
+      await ensureDir(path.dirname(dest));
+      const target = await readAll(await openEntryStream(zip, entry));
+      // Only links that point down from their own folder: with no ".." (which
+      // the OS resolves after following earlier links), no absolute or
+      // Windows drive-relative ("C:foo") path, every link stays inside.
+      if (
+        path.isAbsolute(target) ||
+        DRIVE_PREFIX_RE.test(target) ||
+        hasParentSegment(target) ||
+        !isInside(root, path.resolve(path.dirname(dest), target))
+      ) {
+        throw new Error(`Refusing symlink pointing outside target: ${entry.fileName}`);
+      }
+      await fs.promises.symlink(target, dest);
+      report(entry);
+    }
+  } finally {
+    // Every started entry has settled by now (forEachEntry waits for them).
+    zip.close();
+  }
+}
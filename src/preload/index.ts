@@ -31,9 +31,18 @@ const api = {
   smbMount: (): Promise<MountStatus> => ipcRenderer.invoke('smb:mount'),
   smbUnmount: (): Promise<MountStatus> => ipcRenderer.invoke('smb:unmount'),
   smbStatus: (): Promise<MountStatus> => ipcRenderer.invoke('smb:status'),
+  /** Fired when the main process sees the share's mount status change. */
+  onSmbStatusChanged: (cb: (status: MountStatus) => void) => {
+    const listener = (_: unknown, status: MountStatus) => cb(status);
+    ipcRenderer.on('smb:statusChanged', listener);
+    return () => ipcRenderer.off('smb:statusChanged', listener);
+  },
 
   listRemoteBackups: (): Promise<BackupFile[]> =>
     ipcRenderer.invoke('remote:list'),
+  /** Names of the zips on the share, without sizes or metadata. */
+  listRemoteBackupNames: (): Promise<string[]> =>
+    ipcRenderer.invoke('remote:listNames'),
   uploadBackup: (absPath: string): Promise<void> =>
     ipcRenderer.invoke('remote:upload', absPath),
   downloadBackup: (remoteName: string): Promise<string> =>
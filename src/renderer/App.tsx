@@ -11,6 +11,7 @@ import { UploadView } from './views/UploadView';
 import { DownloadView } from './views/DownloadView';
 import { SettingsView } from './views/SettingsView';
 import { ActivityDock } from './components/ActivityDock';
+import { formatDate } from './components/format';
 
 type Tab = 'backup' | 'upload' | 'download' | 'settings';
 
@@ -45,17 +46,39 @@ export function App(): JSX.Element {
     refreshConfig();
     refreshMount();
 
-    const off = window.api.onProgress((e) => {
+    // Progress can arrive many times a second during a backup; buffer events
+    // and merge them into state in one pass (and one render) per flush.
+    let pending: ProgressEvent[] = [];
+    let flushTimer: ReturnType<typeof setTimeout> | null = null;
+    function flushEvents(): void {
+      flushTimer = null;
+      const batch = pending;
+      pending = [];
       setEvents((prev) => {
-        const idx = prev.findIndex((p) => p.id === e.id);
-        // Cap at 200 to keep memory bounded for very long sessions.
-        if (idx === -1) return [e, ...prev].slice(0, 200);
         const next = prev.slice();
-        next[idx] = e;
-        return next;
+        for (const e of batch) {
+          const idx = next.findIndex((p) => p.id === e.id);
+          if (idx === -1) next.unshift(e);
+          else next[idx] = e;
+        }
+        // Cap at 200 to keep memory bounded for very long sessions.
+        return next.length > 200 ? next.slice(0, 200) : next;
       });
+    }
+    const off = window.api.onProgress((e) => {
+      pending.push(e);
+      if (flushTimer === null) flushTimer = setTimeout(flushEvents, 100);
     });
-    const mountPoll = setInterval(refreshMount, 5000);
+    // Mounts made by the app are pushed from main; the poll only catches
+    // changes made outside it (Finder, `umount`), so skip it while hidden.
+    const offMount = window.api.onSmbStatusChanged((s) => setMount(s));
+    const mountPoll = setInterval(() => {
+      if (document.visibilityState === 'visible') refreshMount();
+    }, 5000);
+    function onVisibility(): void {
+      if (document.visibilityState === 'visible') refreshMount();
+    }
+    document.addEventListener('visibilitychange', onVisibility);
 
     const offAvailable = window.api.onUpdateAvailable((v) => {
       setUpdateVersion(v);
@@ -83,7 +106,10 @@ export function App(): JSX.Element {
 
     return () => {
       off();
+      if (flushTimer !== null) clearTimeout(flushTimer);
       clearInterval(mountPoll);
+      offMount();
+      document.removeEventListener('visibilitychange', onVisibility);
       offAvailable();
       offProgress();
       offDownloaded();
@@ -181,7 +207,7 @@ export function App(): JSX.Element {
             <span className="sync-banner__label">
               Newer {item.flavor === 'unknown' ? '' : <code>{item.flavor}</code>} backup
               from <strong>{item.sourceHostname}</strong> (
-              {new Date(item.createdAtIso).toLocaleString()}) is available.
+              {formatDate(item.createdAtIso)}) is available.
             </span>
             <button
               className="sync-banner__btn sync-banner__btn--primary"
@@ -1,4 +1,4 @@
-import React, { useEffect, useRef, useState } from 'react';
+import React, { useEffect, useMemo, useRef, useState } from 'react';
 import type { ProgressEvent } from '../../shared/types';
 
 /**
@@ -44,17 +44,18 @@ export function ActivityDock({
     };
   }, [open]);
 
-  const active = events.filter((e) => e.phase === 'start' || e.phase === 'progress').length;
-  const errored = events.some((e) => e.phase === 'error');
+  // One pass over the history, and only when it changes (not on open/close).
+  const { active, errored } = useMemo(() => {
+    let activeCount = 0;
+    let anyError = false;
+    for (const e of events) {
+      if (e.phase === 'start' || e.phase === 'progress') activeCount++;
+      else if (e.phase === 'error') anyError = true;
+    }
+    return { active: activeCount, errored: anyError };
+  }, [events]);
   const total = events.length;
 
-  // Sort newest-first for display.
-  const ordered = [...events].sort((a, b) => {
-    // events array is already roughly newest-first (App pushes new ones to front),
-    // but ensure a stable order when timestamps tie.
-    return 0;
-  });
-
   return (
     <>
       <button
@@ -111,7 +112,8 @@ export function ActivityDock({
             </div>
           ) : (
             <ol className="activity-dock__list">
-              {ordered.map((e) => (
+              {/* App keeps events newest-first already. */}
+              {events.map((e) => (
                 <li key={e.id} className={`activity-item activity-item--${e.phase}`}>
                   <div className="activity-item__row">
                     <span className="activity-item__label">{e.label}</span>
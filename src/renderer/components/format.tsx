@@ -7,11 +7,22 @@ export function formatBytes(n: number): string {
   return `${(n / 1024 / 1024 / 1024).toFixed(2)} GB`;
 }
 
+// Same fields Date#toLocaleString() prints by default, but the locale and
+// pattern are resolved once instead of on every call (lists render many rows).
+const DATE_TIME_FORMAT = new Intl.DateTimeFormat(undefined, {
+  year: 'numeric',
+  month: 'numeric',
+  day: 'numeric',
+  hour: 'numeric',
+  minute: 'numeric',
+  second: 'numeric'
+});
+
 export function formatDate(iso: string): string {
   try {
-    const d = new Date(iso);
-    return d.toLocaleString();
+    return DATE_TIME_FORMAT.format(new Date(iso));
   } catch {
+    // Invalid dates throw RangeError; show the raw value instead.
     return iso;
   }
 }
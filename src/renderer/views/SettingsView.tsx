@@ -7,6 +7,7 @@ import type {
   SchedulerStatus,
   ThemePreference
 } from '../../shared/types';
+import { formatDate } from '../components/format';
 
 type SectionId =
   | 'wow'
@@ -18,6 +19,16 @@ type SectionId =
   | 'jobs'
   | 'appearance';
 
+const COMPRESSION_LEVELS = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9];
+
+function compressionLabel(level: number): string {
+  if (level === 0) return '0 — Store only (no compression)';
+  if (level === 1) return '1 — Fastest';
+  if (level === 6) return '6 — Balanced (recommended)';
+  if (level === 9) return '9 — Smallest, slowest';
+  return String(level);
+}
+
 function Section({
   id,
   title,
@@ -76,27 +87,17 @@ export function SettingsView({
     setOpen((o) => ({ ...o, [id]: !o[id] }));
   }
 
+  // Live-updating background-job + scheduler snapshot. The main process
+  // broadcasts `jobs:updated` whenever a job runs or its next-run changes
+  // (the scheduler included), so there is nothing to poll for in between.
   useEffect(() => {
     window.api.getSchedulerStatus().then(setSchedulerStatus).catch(() => {});
-    const t = setInterval(() => {
-      window.api.getSchedulerStatus().then(setSchedulerStatus).catch(() => {});
-    }, 15000);
-    return () => clearInterval(t);
-  }, []);
-
-  // Live-updating background-job snapshot.
-  useEffect(() => {
     window.api.getJobs().then(setJobs).catch(() => {});
-    const off = window.api.onJobsUpdated(setJobs);
-    // Refresh every 30 s so 'next run' clocks stay roughly in sync even when
-    // no broadcast fires (e.g. between sync polls).
-    const t = setInterval(() => {
-      window.api.getJobs().then(setJobs).catch(() => {});
-    }, 30000);
-    return () => {
-      off();
-      clearInterval(t);
-    };
+    const off = window.api.onJobsUpdated((next) => {
+      setJobs(next);
+      window.api.getSchedulerStatus().then(setSchedulerStatus).catch(() => {});
+    });
+    return off;
   }, []);
 
   // Sync in coming config prop (e.g. after external theme change) so draft matches.
@@ -228,6 +229,22 @@ export function SettingsView({
             />
           </div>
         )}
+
+        <div className="field">
+          <label>Compression</label>
+          <select
+            value={draft.compressionLevel ?? 6}
+            onChange={(e) =>
+              setDraft({ ...draft, compressionLevel: Number(e.target.value) })
+            }
+          >
+            {COMPRESSION_LEVELS.map((level) => (
+              <option key={level} value={level}>
+                {compressionLabel(level)}
+              </option>
+            ))}
+          </select>
+        </div>
       </Section>
 
       <Section
@@ -556,12 +573,12 @@ export function SettingsView({
                 >
                   {schedulerStatus.lastRunIso && (
                     <div>
-                      Last run: {new Date(schedulerStatus.lastRunIso).toLocaleString()}
+                      Last run: {formatDate(schedulerStatus.lastRunIso)}
                     </div>
                   )}
                   {schedulerStatus.nextRunIso && (
                     <div>
-                      Next run: {new Date(schedulerStatus.nextRunIso).toLocaleString()}
+                      Next run: {formatDate(schedulerStatus.nextRunIso)}
                     </div>
                   )}
                   {!schedulerStatus.nextRunIso &&
@@ -574,7 +591,7 @@ export function SettingsView({
                   <div className="chip chip--bad" style={{ marginTop: 6 }}>
                     Last error
                     {schedulerStatus.lastErrorIso
-                      ? ` (${new Date(schedulerStatus.lastErrorIso).toLocaleString()})`
+                      ? ` (${formatDate(schedulerStatus.lastErrorIso)})`
                       : ''}
                     : {schedulerStatus.lastError}
                   </div>
@@ -677,11 +694,11 @@ export function SettingsView({
                 <div>
                   Last ran:{' '}
                   {j.lastRunIso
-                    ? new Date(j.lastRunIso).toLocaleString()
+                    ? formatDate(j.lastRunIso)
                     : 'never'}
                 </div>
                 {j.nextRunIso && (
-                  <div>Next run: {new Date(j.nextRunIso).toLocaleString()}</div>
+                  <div>Next run: {formatDate(j.nextRunIso)}</div>
                 )}
                 {j.lastMessage && <div>Detail: {j.lastMessage}</div>}
               </div>
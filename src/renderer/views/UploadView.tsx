@@ -4,14 +4,14 @@ import { Empty, Skeleton, formatBytes, formatDate } from '../components/format';
 
 export function UploadView({ mounted }: { mounted: boolean }): JSX.Element {
   const [local, setLocal] = useState<BackupFile[] | null>(null);
-  const [remote, setRemote] = useState<BackupFile[]>([]);
+  const [remote, setRemote] = useState<string[]>([]);
   const [busy, setBusy] = useState(false);
 
   async function refresh(): Promise<void> {
     setLocal(await window.api.listLocalBackups());
     if (mounted) {
       try {
-        setRemote(await window.api.listRemoteBackups());
+        setRemote(await window.api.listRemoteBackupNames());
       } catch (err) {
         console.warn(err);
         setRemote([]);
@@ -25,7 +25,7 @@ export function UploadView({ mounted }: { mounted: boolean }): JSX.Element {
     refresh();
   }, [mounted]);
 
-  const remoteNames = new Set(remote.map((r) => r.name));
+  const remoteNames = new Set(remote);
   const localList = local ?? [];
   const uploadable = localList.filter((b) => b.name.endsWith('.zip'));
   const missingCount = uploadable.filter((b) => !remoteNames.has(b.name)).length;
@@ -105,6 +105,16 @@ export interface AppConfig {
   retentionCount: number;
   /** Which retention strategy to use: Time Machine style tiers or a simple fixed count. */
   retentionMode: RetentionMode;
+  /**
+   * DEFLATE level for new backups, 0 (store only) to 9. Above 6 costs a lot
+   * more CPU for a percent or two smaller archives on Lua/text-heavy AddOns.
+   */
+  compressionLevel: number;
+  /**
+   * Files copied at once when a restore has to copy instead of move
+   * (config.json only). 0 picks a value from the CPU count.
+   */
+  copyConcurrency: number;
   /** SMB share config + auto-mount toggle. */
   smb: SmbMountConfig;
   /** Automatic scheduled backup configuration. */
@@ -234,7 +244,9 @@ export type IpcChannel =
   | 'smb:mount'
   | 'smb:unmount'
   | 'smb:status'
+  | 'smb:statusChanged'
   | 'remote:list'
+  | 'remote:listNames'
   | 'remote:upload'
   | 'remote:download'
   | 'restore:fromZip'